@@ -10,18 +10,25 @@ Provides the ``hecras-check`` entry point with four commands:
 
 from __future__ import annotations
 
+import functools
+import math
+import os
 import shutil
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 import click
 import yaml
 
 from hecras_compliance.parsers import parse_geometry, parse_plan, parse_flow, parse_project
-from hecras_compliance.reporting.markdown_report import generate_markdown_report
-from hecras_compliance.reporting.pdf_report import generate_pdf_report
 from hecras_compliance.rules.engine import ComplianceEngine, ModelData, RuleResult, load_rules
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 # ---------------------------------------------------------------------------
 # Symbols & colors
 # ---------------------------------------------------------------------------
@@ -31,34 +38,58 @@ _FAIL = click.style("\u2717 FAIL", fg="red", bold=True)
 _WARN = click.style("\u26A0 WARN", fg="yellow", bold=True)
 _SKIP = click.style("- SKIP", fg="white", dim=True)
 _INFO = click.style("i INFO", fg="cyan")
+_CHECK_GREEN = click.style("\u2713", fg="green")
+_X_RED = click.style("\u2717", fg="red")
+
+# Opening ANSI sequences for values only known at run time (counts, rule IDs)
+_GREEN_BOLD = click.style("", fg="green", bold=True, reset=False)
+_RED_BOLD = click.style("", fg="red", bold=True, reset=False)
+_YELLOW_BOLD = click.style("", fg="yellow", bold=True, reset=False)
+_BLUE_BOLD = click.style("", fg="blue", bold=True, reset=False)
+_MAGENTA_BOLD = click.style("", fg="magenta", bold=True, reset=False)
+_DIM = click.style("", dim=True, reset=False)
+_RESET = "\x1b[0m"
+
+# Section separators
+_SEP_EQ_40 = click.style("=" * 40, dim=True)
+_SEP_EQ_50 = click.style("=" * 50, dim=True)
+_SEP_EQ_60 = click.style("=" * 60, dim=True)
+_SEP_DASH_40 = click.style("-" * 40, dim=True)
+_SEP_DASH_30 = click.style("  " + "-" * 30, dim=True)  # indented sub-section rule
+
+
+_STATUS_STYLE: dict[str, str] = {
+    "PASS": _PASS,
+    "FAIL": _FAIL,
+    "WARNING": _WARN,
+    "SKIPPED": _SKIP,
+}
+
+_SEVERITY_STYLE: dict[str, str] = {
+    "error": click.style("error", fg="red"),
+    "warning": click.style("warning", fg="yellow"),
+    "info": click.style("info", fg="cyan"),
+}
 
 
 def _status_styled(status: str) -> str:
-    return {
-        "PASS": _PASS,
-        "FAIL": _FAIL,
-        "WARNING": _WARN,
-        "SKIPPED": _SKIP,
-    }.get(status, status)
+    return _STATUS_STYLE.get(status, status)
 
 
 def _severity_styled(severity: str) -> str:
-    return {
-        "error": click.style("error", fg="red"),
-        "warning": click.style("warning", fg="yellow"),
-        "info": click.style("info", fg="cyan"),
-    }.get(severity, severity)
+    return _SEVERITY_STYLE.get(severity, severity)
 
 
 # ---------------------------------------------------------------------------
 # State abbreviation → full state name mapping
 # ---------------------------------------------------------------------------
 
-_STATE_ABBREVS: dict[str, str] = {
-    "TX": "texas",
-    "TEXAS": "texas",
-    "ME": "maine",
-    "MAINE": "maine",
+# Keys are casefolded so a single normalization handles "TX", "tx", "Texas" …
+_STATE_NORMALIZE: dict[str, str] = {
+    "tx": "texas",
+    "texas": "texas",
+    "me": "maine",
+    "maine": "maine",
 }
 
 _STATES_DIR = Path(__file__).resolve().parent / "config" / "states"
@@ -68,63 +99,130 @@ def _resolve_state(state: str | None) -> str | None:
     """Normalize a state argument to the lowercase name used for file lookup."""
     if state is None:
         return None
-    upper = state.upper()
-    if upper in _STATE_ABBREVS:
-        return _STATE_ABBREVS[upper]
-    return state.lower()
+    folded = state.casefold()
+    return _STATE_NORMALIZE.get(folded, folded)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_state_yaml(yaml_path: Path, mtime_ns: int) -> dict:
+    """Parse a state YAML file; *mtime_ns* is part of the cache key only."""
+    with open(yaml_path, "rb") as fh:
+        return yaml.load(fh, Loader=_SafeLoader) or {}
+
+
+def _load_state_yaml(state_key: str) -> dict | None:
+    """Return the parsed state YAML for *state_key*, or ``None`` if missing.
+
+    Results are memoized per file and re-read only when the file's
+    modification time changes.
+    """
+    yaml_path = _STATES_DIR / f"{state_key}.yaml"
+    try:
+        mtime_ns = yaml_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _read_state_yaml(yaml_path, mtime_ns)
 
 
 def _state_display_name(state_key: str | None) -> str | None:
     """Get a human-friendly state name by reading the YAML file's 'state' field."""
     if state_key is None:
         return None
-    yaml_path = _STATES_DIR / f"{state_key}.yaml"
-    if yaml_path.exists():
-        data = yaml.safe_load(yaml_path.read_text())
+    data = _load_state_yaml(state_key)
+    if data is not None:
         return data.get("state", state_key.title())
     return state_key.title()
 
 
+def _resolve_state_and_label(state: str | None) -> tuple[str | None, str | None]:
+    """Return ``(state_key, display_name)`` for a ``--state`` argument."""
+    state_key = _resolve_state(state)
+    return state_key, _state_display_name(state_key)
+
+
 # ---------------------------------------------------------------------------
 # Helper: parse model from .prj
 # ---------------------------------------------------------------------------
 
-def _load_model(prj_path: Path) -> tuple[ModelData, str]:
-    """Parse a .prj file and all referenced files, return (ModelData, basename)."""
+def _list_files(base_dir: Path) -> dict[str, str]:
+    """Map the regular files in *base_dir* by name and by casefolded name.
+
+    Each file is keyed by its own name and, unless that key is already
+    taken by another file's exact name, by ``name.casefold()``.  The value
+    is always the name as it appears on disk.
+    """
+    try:
+        with os.scandir(base_dir) as entries:
+            names = [e.name for e in entries if e.is_file()]
+    except OSError:
+        return {}
+    present = dict(zip(names, names))
+    for name in names:
+        present.setdefault(name.casefold(), name)
+    return present
+
+
+def _first_existing(
+    base_dir: Path, present: dict[str, str], stem: str, exts: list[str],
+) -> Path | None:
+    """Return the first ``{stem}.{ext}`` under *base_dir* listed in *present*.
+
+    An exact name wins; otherwise the name is matched ignoring case, since
+    the .prj spelling need not match the file on disk (HEC-RAS runs on
+    case-insensitive file systems).
+    """
+    for ext in exts:
+        name = f"{stem}.{ext}"
+        found = present.get(name) or present.get(name.casefold())
+        if found is not None:
+            return base_dir / found
+    return None
+
+
+def _load_model(
+    prj_path: Path,
+    *,
+    skip_geometry: bool = False,
+    skip_plan: bool = False,
+    skip_flow: bool = False,
+) -> tuple[ModelData, str]:
+    """Parse a .prj file and all referenced files, return (ModelData, basename).
+
+    The geometry, plan, and flow files are parsed in that order.  Any of
+    them can be skipped with the ``skip_*`` flags, in which case the
+    corresponding :class:`ModelData` field is left as ``None``.
+    """
     project = parse_project(prj_path)
     base_dir = prj_path.parent
     stem = prj_path.stem
+    if skip_geometry and skip_plan and skip_flow:
+        return ModelData(project=project), prj_path.name
 
-    geometry = None
-    plan = None
-    flow = None
+    present = _list_files(base_dir)
+    gpath = ppath = fpath = None
 
     # Geometry — use the first available file
-    for ext in project.geom_files:
-        gpath = base_dir / f"{stem}.{ext}"
-        if gpath.exists():
-            geometry = parse_geometry(gpath)
-            break
+    if not skip_geometry:
+        gpath = _first_existing(base_dir, present, stem, project.geom_files)
 
     # Plan — use current plan, else first available
-    plan_exts = []
-    if project.current_plan:
-        plan_exts.append(project.current_plan)
-    plan_exts.extend(project.plan_files)
-    for ext in plan_exts:
-        ppath = base_dir / f"{stem}.{ext}"
-        if ppath.exists():
-            plan = parse_plan(ppath)
-            break
+    if not skip_plan:
+        plan_exts = []
+        if project.current_plan:
+            plan_exts.append(project.current_plan)
+        plan_exts.extend(project.plan_files)
+        ppath = _first_existing(base_dir, present, stem, plan_exts)
 
     # Flow — prefer steady, then unsteady
-    for ext in project.all_flow_files:
-        fpath = base_dir / f"{stem}.{ext}"
-        if fpath.exists():
-            flow = parse_flow(fpath)
-            break
-
-    model = ModelData(geometry=geometry, plan=plan, flow=flow, project=project)
+    if not skip_flow:
+        fpath = _first_existing(base_dir, present, stem, project.all_flow_files)
+
+    model = ModelData(
+        geometry=parse_geometry(gpath) if gpath else None,
+        plan=parse_plan(ppath) if ppath else None,
+        flow=parse_flow(fpath) if fpath else None,
+        project=project,
+    )
     return model, prj_path.name
 
 
@@ -154,12 +252,11 @@ def run(project_file: str, state: str | None, output: str | None, pdf: bool):
     PROJECT_FILE is the path to a .prj project file.
     """
     prj_path = Path(project_file)
-    state_key = _resolve_state(state)
-    state_label = _state_display_name(state_key)
+    state_key, state_label = _resolve_state_and_label(state)
 
     click.echo()
     click.secho("HEC-RAS Compliance Checker", bold=True)
-    click.secho("=" * 40, dim=True)
+    click.echo(_SEP_EQ_40)
     click.echo(f"  Model:  {prj_path.name}")
     click.echo(f"  State:  {state_label or 'Federal only'}")
     click.echo()
@@ -168,16 +265,19 @@ def run(project_file: str, state: str | None, output: str | None, pdf: bool):
     click.echo("Parsing model files...")
     model, model_name = _load_model(prj_path)
 
-    parsed = []
+    parsed: list[str] = []
     if model.geometry:
-        parsed.append(f"geometry ({len(model.geometry.cross_sections)} XS, {len(model.geometry.bridges)} bridges)")
+        parsed.append(
+            f"  {_CHECK_GREEN} geometry ({len(model.geometry.cross_sections)} XS, "
+            f"{len(model.geometry.bridges)} bridges)"
+        )
     if model.plan:
-        parsed.append(f"plan (type {model.plan.plan_type})")
+        parsed.append(f"  {_CHECK_GREEN} plan (type {model.plan.plan_type})")
     if model.flow:
         n_profiles = len(model.flow.profiles) if model.flow.profiles else 0
-        parsed.append(f"flow ({n_profiles} profiles)")
-    for p in parsed:
-        click.echo(f"  {click.style('\u2713', fg='green')} {p}")
+        parsed.append(f"  {_CHECK_GREEN} flow ({n_profiles} profiles)")
+    if parsed:
+        click.echo("\n".join(parsed))
     click.echo()
 
     # Evaluate
@@ -185,63 +285,73 @@ def run(project_file: str, state: str | None, output: str | None, pdf: bool):
     engine = ComplianceEngine(state=state_key)
     results = engine.evaluate(model)
 
-    n_pass = sum(1 for r in results if r.status == "PASS")
-    n_fail = sum(1 for r in results if r.status == "FAIL")
-    n_warn = sum(1 for r in results if r.status == "WARNING")
-    n_skip = sum(1 for r in results if r.status == "SKIPPED")
+    # Bucket by status and format the result rows in a single pass.
+    by_status: dict[str, list[RuleResult]] = defaultdict(list)
+    rows: list[str] = []
+    for r in results:
+        by_status[r.status].append(r)
+        loc = f" @ {r.location}" if r.location else ""
+        rows.append(f"  {_status_styled(r.status)}  {r.rule_name}{loc}")
+    failures = by_status["FAIL"]
+    n_pass = len(by_status["PASS"])
+    n_fail = len(failures)
+    n_warn = len(by_status["WARNING"])
+    n_skip = len(by_status["SKIPPED"])
 
     click.echo()
     click.secho("Results", bold=True)
-    click.secho("-" * 40, dim=True)
+    click.echo(_SEP_DASH_40)
 
-    # Print each result
-    for r in results:
-        loc = f" @ {r.location}" if r.location else ""
-        click.echo(f"  {_status_styled(r.status)}  {r.rule_name}{loc}")
+    # Print each result (one write for the whole block)
+    if rows:
+        click.echo("\n".join(rows))
 
     # Summary
     click.echo()
     click.secho("Summary", bold=True)
-    click.secho("-" * 40, dim=True)
-    click.echo(f"  {click.style(str(n_pass), fg='green', bold=True)} passed   "
-               f"{click.style(str(n_fail), fg='red', bold=True)} failed   "
-               f"{click.style(str(n_warn), fg='yellow', bold=True)} warnings   "
-               f"{click.style(str(n_skip), dim=True)} skipped")
+    click.echo(_SEP_DASH_40)
+    click.echo(f"  {_GREEN_BOLD}{n_pass}{_RESET} passed   "
+               f"{_RED_BOLD}{n_fail}{_RESET} failed   "
+               f"{_YELLOW_BOLD}{n_warn}{_RESET} warnings   "
+               f"{_DIM}{n_skip}{_RESET} skipped")
 
     if n_fail > 0:
         click.echo()
         click.secho(f"  {n_fail} critical failure(s) must be resolved before submission.", fg="red", bold=True)
         click.echo()
-        for r in results:
-            if r.status == "FAIL":
-                loc = f" at {r.location}" if r.location else ""
-                click.echo(f"  {click.style('\u2717', fg='red')} {r.rule_id} — {r.rule_name}{loc}")
-                click.echo(f"    Model has: {r.actual_value}")
-                click.echo(f"    Required:  {r.expected_value}")
-                click.echo(f"    {r.message}")
-                click.echo()
+        for r in failures:
+            loc = f" at {r.location}" if r.location else ""
+            click.echo(f"  {_X_RED} {r.rule_id} — {r.rule_name}{loc}")
+            click.echo(f"    Model has: {r.actual_value}")
+            click.echo(f"    Required:  {r.expected_value}")
+            click.echo(f"    {r.message}")
+            click.echo()
 
     # Reports
     if output or pdf:
         click.echo()
         click.secho("Reports", bold=True)
-        click.secho("-" * 40, dim=True)
+        click.echo(_SEP_DASH_40)
 
     if output:
+        from hecras_compliance.reporting.markdown_report import generate_markdown_report
+
         md_path = Path(output)
         generate_markdown_report(
             results, model_filename=model_name,
             state=state_label, output_path=md_path,
         )
-        click.echo(f"  {click.style('\u2713', fg='green')} Markdown: {md_path}")
+        click.echo(f"  {_CHECK_GREEN} Markdown: {md_path}")
 
     if pdf:
+        from hecras_compliance.reporting.pdf_report import generate_pdf_report
+
         pdf_path = Path(output).with_suffix(".pdf") if output else Path("compliance_report.pdf")
         generate_pdf_report(
             results, model_filename=model_name,
             state=state_label, output_path=pdf_path,
         )
-        click.echo(f"  {click.style('\u2713', fg='green')} PDF:      {pdf_path}")
+        click.echo(f"  {_CHECK_GREEN} PDF:      {pdf_path}")
 
     click.echo()
 
@@ -258,8 +368,7 @@ def list_rules(state: str | None):
     Shows federal FEMA rules and any state-specific rules. State rules may
     supersede federal rules.
     """
-    state_key = _resolve_state(state)
-    state_label = _state_display_name(state_key)
+    state_key, state_label = _resolve_state_and_label(state)
 
     rules = load_rules(state=state_key)
 
@@ -269,29 +378,35 @@ def list_rules(state: str | None):
         click.echo(f"  Federal (FEMA) + {state_label}")
     else:
         click.echo("  Federal (FEMA) only")
-    click.secho("=" * 60, dim=True)
+    click.echo(_SEP_EQ_60)
     click.echo()
 
-    # Determine column widths
-    id_w = max(len(r["id"]) for r in rules) if rules else 12
-    name_w = max(len(r["name"]) for r in rules) if rules else 20
+    # Determine column widths (one pass over the rules)
+    if rules:
+        id_w = name_w = 0
+        for r in rules:
+            id_w = max(id_w, len(r["id"]))
+            name_w = max(name_w, len(r["name"]))
+    else:
+        id_w, name_w = 12, 20
     # Cap name width for readability
     term_w = shutil.get_terminal_size((80, 24)).columns
     name_w = min(name_w, term_w - id_w - 20)
 
+    rows: list[str] = []
     for rule in rules:
         rid = rule["id"]
         name = rule["name"]
         severity = rule.get("severity", "")
 
         # Color the rule ID by origin
-        if rid.startswith("FEMA"):
-            id_str = click.style(rid.ljust(id_w), fg="blue", bold=True)
-        else:
-            id_str = click.style(rid.ljust(id_w), fg="magenta", bold=True)
+        id_open = _BLUE_BOLD if rid.startswith("FEMA") else _MAGENTA_BOLD
+        id_str = f"{id_open}{rid.ljust(id_w)}{_RESET}"
 
         sev_str = _severity_styled(severity)
-        click.echo(f"  {id_str}  {name.ljust(name_w)}  [{sev_str}]")
+        rows.append(f"  {id_str}  {name.ljust(name_w)}  [{sev_str}]")
+    if rows:
+        click.echo("\n".join(rows))
 
     click.echo()
     click.echo(f"  {len(rules)} rules total")
@@ -304,17 +419,21 @@ def list_rules(state: str | None):
 
 @cli.command()
 @click.argument("project_file", type=click.Path(exists=True, dir_okay=False))
-def summary(project_file: str):
+@click.option("--quick", is_flag=True,
+              help="Only read the .prj file (skip geometry, plan and flow parsing).")
+def summary(project_file: str, quick: bool):
     """Show a quick summary of a HEC-RAS model (no compliance check).
 
     PROJECT_FILE is the path to a .prj project file.
     """
     prj_path = Path(project_file)
-    model, model_name = _load_model(prj_path)
+    model, model_name = _load_model(
+        prj_path, skip_geometry=quick, skip_plan=quick, skip_flow=quick,
+    )
 
     click.echo()
     click.secho("Model Summary", bold=True)
-    click.secho("=" * 50, dim=True)
+    click.echo(_SEP_EQ_50)
     click.echo(f"  File:   {model_name}")
 
     # Project info
@@ -330,7 +449,7 @@ def summary(project_file: str):
         click.echo()
 
         click.secho("  Referenced Files", bold=True)
-        click.secho("  " + "-" * 30, dim=True)
+        click.echo(_SEP_DASH_30)
         for ext in p.geom_files:
             click.echo(f"    Geometry:  {prj_path.stem}.{ext}")
         for ext in p.plan_files:
@@ -345,24 +464,37 @@ def summary(project_file: str):
         g = model.geometry
         click.echo()
         click.secho("  Geometry", bold=True)
-        click.secho("  " + "-" * 30, dim=True)
+        click.echo(_SEP_DASH_30)
         click.echo(f"    Cross sections:  {len(g.cross_sections)}")
         click.echo(f"    Bridges:         {len(g.bridges)}")
 
         if g.cross_sections:
-            stations = [xs.river_station for xs in g.cross_sections]
-            click.echo(f"    Station range:   {min(stations):.1f} – {max(stations):.1f}")
-
-            n_vals = [xs.manning_n_channel for xs in g.cross_sections if xs.manning_n_channel is not None]
-            if n_vals:
-                click.echo(f"    Channel n range: {min(n_vals):.3f} – {max(n_vals):.3f}")
+            # Station and channel-n extremes in a single pass
+            s_min, s_max = math.inf, -math.inf
+            n_min, n_max = math.inf, -math.inf
+            for xs in g.cross_sections:
+                sta = xs.river_station
+                if sta < s_min:
+                    s_min = sta
+                if sta > s_max:
+                    s_max = sta
+                n = xs.manning_n_channel
+                if n is not None:
+                    if n < n_min:
+                        n_min = n
+                    if n > n_max:
+                        n_max = n
+            click.echo(f"    Station range:   {s_min:.1f} – {s_max:.1f}")
+
+            if n_min <= n_max:
+                click.echo(f"    Channel n range: {n_min:.3f} – {n_max:.3f}")
 
     # Plan
     if model.plan:
         pl = model.plan
         click.echo()
         click.secho("  Plan", bold=True)
-        click.secho("  " + "-" * 30, dim=True)
+        click.echo(_SEP_DASH_30)
         ptype = {1: "Steady", 2: "Unsteady", 3: "Quasi-Unsteady"}.get(pl.plan_type, str(pl.plan_type))
         click.echo(f"    Type:        {ptype}")
         if pl.flow_regime:
@@ -380,7 +512,7 @@ def summary(project_file: str):
         f = model.flow
         click.echo()
         click.secho("  Flow", bold=True)
-        click.secho("  " + "-" * 30, dim=True)
+        click.echo(_SEP_DASH_30)
         flow_type = "Steady" if f.is_steady else "Unsteady"
         click.echo(f"    Type:     {flow_type}")
         if f.profiles:
@@ -396,6 +528,81 @@ def summary(project_file: str):
 # add-state
 # ---------------------------------------------------------------------------
 
+# Field order of every generated rule; new rules start as a copy of this
+# preallocated dict so assignments fill existing slots in YAML output order.
+_RULE_TEMPLATE = dict.fromkeys([
+    "id", "name", "description", "severity", "citation",
+    "check_type", "parameters", "applies_to",
+])
+
+# Rule templates offered by the wizard.  String values are filled in with
+# ``str.format_map`` against the per-state context built in ``add_state``.
+_ZERO_RISE_TEMPLATE: dict = {
+    "id": "{abbrev}-FW-001",
+    "name": "Zero-rise floodway requirement",
+    "description": "{state} requires zero-rise in the regulatory floodway.",
+    "severity": "error",
+    "citation": "{citation}",
+    "check_type": "range",
+    "parameters": {"min": 0.0, "max": 0.0},
+    "applies_to": "plan.encroachment.target_surcharge",
+}
+
+_EVENT_TEMPLATE: dict = {
+    "id": "{abbrev}-EVENT-{idx:03d}",
+    "name": "{event_desc} flood required",
+    "description": "{state} requires analysis of the {event_desc} flood event.",
+    "severity": "error",
+    "citation": "{citation}",
+    "check_type": "custom",
+    "parameters": {
+        "handler": "check_profile_exists",
+        "accepted_names": ["{event_name}", "{event_name_dashed}"],
+    },
+    "applies_to": "flow.profile_names",
+}
+
+_FREEBOARD_TEMPLATE: dict = {
+    "id": "{abbrev}-FB-001",
+    "name": "Freeboard requirement (manual review)",
+    "description": "{state} freeboard requirements vary by jurisdiction. Flagged for manual review.",
+    "severity": "info",
+    "citation": "{state} state and local regulations (update with specific citation)",
+    "check_type": "custom",
+    "parameters": {
+        "handler": "flag_for_manual_review",
+        "review_note": "Verify the applicable {state} local freeboard ordinance.",
+    },
+    "applies_to": "plan.encroachment.target_surcharge",
+}
+
+_FLOOD_EVENTS = (
+    ("10yr", "10-percent annual chance"),
+    ("50yr", "2-percent annual chance"),
+    ("100yr", "1-percent annual chance"),
+    ("500yr", "0.2-percent annual chance"),
+)
+
+
+def _build_rule(template: dict, ctx: dict) -> dict:
+    """Instantiate one of the rule templates above for a new state."""
+    rule = _RULE_TEMPLATE.copy()
+    for key in rule:
+        rule[key] = _fill_template(template[key], ctx)
+    return rule
+
+
+def _fill_template(value, ctx: dict):
+    """Return a copy of *value* with every string formatted against *ctx*."""
+    if isinstance(value, str):
+        return value.format_map(ctx)
+    if isinstance(value, dict):
+        return {k: _fill_template(v, ctx) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill_template(v, ctx) for v in value]
+    return value
+
+
 @cli.command("add-state")
 def add_state():
     """Interactive wizard to create a new state YAML rules file.
@@ -405,12 +612,18 @@ def add_state():
     """
     click.echo()
     click.secho("Add New State Rules", bold=True)
-    click.secho("=" * 40, dim=True)
+    click.echo(_SEP_EQ_40)
     click.echo()
 
     # Collect state info
     state_name = click.prompt("  State name (e.g. Florida)")
     state_abbrev = click.prompt("  State abbreviation (e.g. FL)")
+    abbrev = state_abbrev.upper()
+    ctx = {
+        "state": state_name,
+        "abbrev": abbrev,
+        "citation": f"{state_name} state regulations (update with specific citation)",
+    }
 
     # Check if file already exists
     filename = state_name.lower().replace(" ", "_") + ".yaml"
@@ -441,7 +654,7 @@ def add_state():
 
     data = {
         "state": state_name,
-        "state_abbreviation": state_abbrev.upper(),
+        "state_abbreviation": abbrev,
         "supersedes": supersedes,
         "rules": [],
     }
@@ -454,62 +667,32 @@ def add_state():
 
     # Zero-rise floodway
     if click.confirm("  Add zero-rise floodway rule?", default=False):
-        data["rules"].append({
-            "id": f"{state_abbrev.upper()}-FW-001",
-            "name": "Zero-rise floodway requirement",
-            "description": f"{state_name} requires zero-rise in the regulatory floodway.",
-            "severity": "error",
-            "citation": f"{state_name} state regulations (update with specific citation)",
-            "check_type": "range",
-            "parameters": {"min": 0.0, "max": 0.0},
-            "applies_to": "plan.encroachment.target_surcharge",
-        })
+        rule = _build_rule(_ZERO_RISE_TEMPLATE, ctx)
+        data["rules"].append(rule)
         if "FEMA-FW-001" not in supersedes:
             supersedes.append("FEMA-FW-001")
             data["supersedes"] = supersedes
-        click.echo(f"    {click.style('\u2713', fg='green')} Added {state_abbrev.upper()}-FW-001")
+        click.echo(f"    {_CHECK_GREEN} Added {rule['id']}")
 
     # Required flood events
     if click.confirm("  Add required flood event rules?", default=False):
-        events = [
-            ("10yr", "10-percent annual chance"),
-            ("50yr", "2-percent annual chance"),
-            ("100yr", "1-percent annual chance"),
-            ("500yr", "0.2-percent annual chance"),
-        ]
-        for idx, (event_name, event_desc) in enumerate(events, start=1):
+        for idx, (event_name, event_desc) in enumerate(_FLOOD_EVENTS, start=1):
             if click.confirm(f"    Require {event_desc} ({event_name}) event?", default=True):
-                data["rules"].append({
-                    "id": f"{state_abbrev.upper()}-EVENT-{idx:03d}",
-                    "name": f"{event_desc} flood required",
-                    "description": f"{state_name} requires analysis of the {event_desc} flood event.",
-                    "severity": "error",
-                    "citation": f"{state_name} state regulations (update with specific citation)",
-                    "check_type": "custom",
-                    "parameters": {
-                        "handler": "check_profile_exists",
-                        "accepted_names": [event_name, event_name.replace("yr", "-yr")],
-                    },
-                    "applies_to": "flow.profile_names",
+                rule = _build_rule(_EVENT_TEMPLATE, {
+                    **ctx,
+                    "idx": idx,
+                    "event_name": event_name,
+                    "event_name_dashed": event_name.replace("yr", "-yr"),
+                    "event_desc": event_desc,
                 })
-                click.echo(f"    {click.style('\u2713', fg='green')} Added {state_abbrev.upper()}-EVENT-{idx:03d}")
+                data["rules"].append(rule)
+                click.echo(f"    {_CHECK_GREEN} Added {rule['id']}")
 
     # Freeboard manual review
     if click.confirm("  Add freeboard manual review flag?", default=False):
-        data["rules"].append({
-            "id": f"{state_abbrev.upper()}-FB-001",
-            "name": "Freeboard requirement (manual review)",
-            "description": f"{state_name} freeboard requirements vary by jurisdiction. Flagged for manual review.",
-            "severity": "info",
-            "citation": f"{state_name} state and local regulations (update with specific citation)",
-            "check_type": "custom",
-            "parameters": {
-                "handler": "flag_for_manual_review",
-                "review_note": f"Verify the applicable {state_name} local freeboard ordinance.",
-            },
-            "applies_to": "plan.encroachment.target_surcharge",
-        })
-        click.echo(f"    {click.style('\u2713', fg='green')} Added {state_abbrev.upper()}-FB-001")
+        rule = _build_rule(_FREEBOARD_TEMPLATE, ctx)
+        data["rules"].append(rule)
+        click.echo(f"    {_CHECK_GREEN} Added {rule['id']}")
 
     # Write file
     click.echo()
@@ -526,15 +709,19 @@ def add_state():
         f"#\n\n"
     )
 
-    yaml_str = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
-    target_path.write_text(header + yaml_str, encoding="utf-8")
+    with target_path.open("wb") as fh:
+        fh.write(header.encode("utf-8"))
+        yaml.dump(
+            data, fh, Dumper=_SafeDumper, encoding="utf-8",
+            default_flow_style=False, sort_keys=False, allow_unicode=True,
+        )
 
-    click.echo(f"  {click.style('\u2713', fg='green')} Created: {target_path}")
+    click.echo(f"  {_CHECK_GREEN} Created: {target_path}")
     click.echo()
     click.echo("  Next steps:")
     click.echo(f"    1. Edit {filename} to update citations and descriptions")
-    click.echo(f"    2. Run: hecras-check list-rules --state {state_abbrev.upper()}")
-    click.echo(f"    3. Test: hecras-check run model.prj --state {state_abbrev.upper()}")
+    click.echo(f"    2. Run: hecras-check list-rules --state {abbrev}")
+    click.echo(f"    3. Test: hecras-check run model.prj --state {abbrev}")
     click.echo()
 
 
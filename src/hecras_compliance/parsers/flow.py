@@ -8,9 +8,12 @@ specific river stations.
 
 from __future__ import annotations
 
+import io
 import logging
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,13 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
+# Unsteady files can hold multi-MB hydrographs; read them in large blocks.
+_READ_BUFFER_SIZE = 1 << 18
+
+# Leading characters that mark an indented line.  Keyword lines are almost
+# never indented, so lines are only left-stripped (copied) when needed.
+_INDENT = (" ", "\t")
+
 BOUNDARY_TYPES: dict[int, str] = {
     0: "Known WS",
     1: "Critical Depth",
@@ -30,13 +40,13 @@ BOUNDARY_TYPES: dict[int, str] = {
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FlowProfile:
     """A named steady-flow profile (e.g. ``"100yr"``)."""
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowChangeLocation:
     """Location where flow magnitudes are specified.
 
@@ -49,7 +59,7 @@ class FlowChangeLocation:
     flows: list[float] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SteadyBoundaryCondition:
     """Upstream / downstream boundary for a single reach and profile."""
     river: str
@@ -73,7 +83,7 @@ class SteadyBoundaryCondition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UnsteadyBoundaryCondition:
     """One boundary-condition block from an unsteady flow file."""
     river: str
@@ -88,7 +98,7 @@ class UnsteadyBoundaryCondition:
     dss_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowFile:
     """Parsed HEC-RAS flow data (steady *or* unsteady)."""
     title: str = ""
@@ -123,21 +133,28 @@ def _read_fixed_values(
     """
     values: list[float] = []
     idx = start
-    while len(values) < count and idx < len(lines):
-        tokens = lines[idx].split()
-        parsed_any = False
-        for tok in tokens:
-            try:
-                values.append(float(tok))
+    n = len(lines)
+    while len(values) < count and idx < n:
+        tokens = lines[idx].split(None, count - len(values))[:count - len(values)]
+        if not tokens:
+            break
+        try:
+            # Whole line converted in one C-level map; the common case.
+            values.extend(list(map(float, tokens)))
+        except ValueError:
+            # Keep the leading numeric tokens, as a keyword may follow.
+            parsed_any = False
+            for tok in tokens:
+                try:
+                    values.append(float(tok))
+                except ValueError:
+                    break
                 parsed_any = True
-            except ValueError:
-                break
-            if len(values) >= count:
+            if not parsed_any:
                 break
-        if not parsed_any:
-            break
         idx += 1
-    return values[:count], idx
+    # Each row is capped at the remaining count, so no trimming is needed.
+    return values, idx
 
 
 def _float(raw: str, default: float = 0.0) -> float:
@@ -164,31 +181,60 @@ def _int(raw: str, default: int = 0) -> int:
 # Steady-flow parser
 # ---------------------------------------------------------------------------
 
-_BOUNDARY_BLOCK_STARTS = frozenset([
+_BOUNDARY_BLOCK_STARTS: tuple[str, ...] = (
     "Boundary for River Rch & Prof#",
     "River Rch & RM",
     "DSS Import",
-])
+)
+
+_BOUNDARY_FIRST_CHARS = frozenset(k[0] for k in _BOUNDARY_BLOCK_STARTS)
 
 
 def _starts_new_block(line: str) -> bool:
-    stripped = line.strip()
-    return any(stripped.startswith(k) for k in _BOUNDARY_BLOCK_STARTS)
+    """True if the (left-stripped) *line* opens a new steady-flow block."""
+    # Block bodies are mostly numeric, so test the first character first.
+    return (
+        line[:1] in _BOUNDARY_FIRST_CHARS
+        and line.startswith(_BOUNDARY_BLOCK_STARTS)
+    )
+
+
+# Boundary-condition keys mapped to (attribute, converter).
+_STEADY_BC_SETTERS: dict[str, tuple[str, Callable[[str], float]]] = {
+    "Up Type": ("upstream_type", _int),
+    "Dn Type": ("downstream_type", _int),
+    "Dn Slope": ("downstream_slope", _float),
+    "Up Slope": ("upstream_slope", _float),
+    "Dn Known WS": ("downstream_known_ws", _float),
+    "Up Known WS": ("upstream_known_ws", _float),
+}
+
+# Matches any of the keys above, capturing key and raw value in one pass.
+_STEADY_BC_RE = re.compile(
+    "(" + "|".join(map(re.escape, _STEADY_BC_SETTERS)) + r")\s*=(.*)"
+)
 
 
 def _parse_steady(lines: list[str], flow: FlowFile) -> None:
     n_profiles = 0
+    n = len(lines)
+    flow_changes = flow.flow_change_locations
+    bc_setters = _STEADY_BC_SETTERS
+    name_pool: dict[str, str] = {}  # one shared string per river / reach name
+    match_bc = _STEADY_BC_RE.match
     i = 0
-    while i < len(lines):
-        s = lines[i].strip()
+    while i < n:
+        s = lines[i]
+        if s[:1] in _INDENT:
+            s = s.lstrip()
 
         if s.startswith("Number of Profiles="):
-            n_profiles = _int(s.split("=", 1)[1])
+            n_profiles = _int(s.partition("=")[2])
             i += 1
             continue
 
         if s.startswith("Profile Names="):
-            names = s.split("=", 1)[1].split(",")
+            names = s.partition("=")[2].split(",")
             flow.profiles = [
                 FlowProfile(n.strip()) for n in names if n.strip()
             ]
@@ -196,47 +242,39 @@ def _parse_steady(lines: list[str], flow: FlowFile) -> None:
             continue
 
         if s.startswith("River Rch & RM="):
-            parts = s.split("=", 1)[1].split(",")
+            parts = s.partition("=")[2].split(",")
             river = parts[0].strip()
             reach = parts[1].strip() if len(parts) > 1 else ""
+            river = name_pool.setdefault(river, river)
+            reach = name_pool.setdefault(reach, reach)
             try:
                 station = float(parts[2].strip()) if len(parts) > 2 else 0.0
             except ValueError:
                 station = 0.0
             want = n_profiles or len(flow.profiles) or 10
             values, i = _read_fixed_values(lines, i + 1, want)
-            flow.flow_change_locations.append(
-                FlowChangeLocation(river, reach, station, values)
-            )
+            flow_changes.append(FlowChangeLocation(river, reach, station, values))
             continue
 
         if s.startswith("Boundary for River Rch & Prof#="):
-            parts = s.split("=", 1)[1].split(",")
+            parts = s.partition("=")[2].split(",")
             river = parts[0].strip()
             reach = parts[1].strip() if len(parts) > 1 else ""
+            river = name_pool.setdefault(river, river)
+            reach = name_pool.setdefault(reach, reach)
             prof = _int(parts[2]) if len(parts) > 2 else 0
             bc = SteadyBoundaryCondition(river, reach, prof)
             i += 1
-            while i < len(lines):
-                bs = lines[i].strip()
+            while i < n:
+                bs = lines[i]
+                if bs[:1] in _INDENT:
+                    bs = bs.lstrip()
                 if _starts_new_block(bs):
                     break
-                if "=" in bs:
-                    key, _, val = bs.partition("=")
-                    key = key.strip()
-                    val = val.strip()
-                    if key == "Up Type":
-                        bc.upstream_type = _int(val)
-                    elif key == "Dn Type":
-                        bc.downstream_type = _int(val)
-                    elif key == "Dn Slope":
-                        bc.downstream_slope = _float(val)
-                    elif key == "Up Slope":
-                        bc.upstream_slope = _float(val)
-                    elif key == "Dn Known WS":
-                        bc.downstream_known_ws = _float(val)
-                    elif key == "Up Known WS":
-                        bc.upstream_known_ws = _float(val)
+                m = match_bc(bs)
+                if m is not None:
+                    attr, convert = bc_setters[m.group(1)]
+                    setattr(bc, attr, convert(m.group(2)))
                 i += 1
             flow.steady_boundaries.append(bc)
             continue
@@ -248,79 +286,91 @@ def _parse_steady(lines: list[str], flow: FlowFile) -> None:
 # Unsteady-flow parser
 # ---------------------------------------------------------------------------
 
-_HYDRO_KEYWORDS: dict[str, str] = {
-    "Flow Hydrograph": "Flow Hydrograph",
-    "Stage Hydrograph": "Stage Hydrograph",
-    "Lateral Inflow Hydrograph": "Lateral Inflow Hydrograph",
-    "Uniform Lateral Inflow Hydrograph": "Uniform Lateral Inflow Hydrograph",
-    "Gate Openings": "Gate Openings",
-    "Rating Curve": "Rating Curve",
-    "Precipitation Hydrograph": "Precipitation Hydrograph",
-}
+# Data keywords; each is also the resulting ``bc_type``.  Longest first so
+# no keyword can be shadowed by a shorter one it contains.
+_HYDRO_KEYWORDS: tuple[str, ...] = (
+    "Uniform Lateral Inflow Hydrograph",
+    "Lateral Inflow Hydrograph",
+    "Precipitation Hydrograph",
+    "Stage Hydrograph",
+    "Flow Hydrograph",
+    "Gate Openings",
+    "Rating Curve",
+)
 
+_HYDRO_FIRST_CHARS = frozenset(k[0] for k in _HYDRO_KEYWORDS)
 
-def _parse_unsteady(lines: list[str], flow: FlowFile) -> None:
-    # Locate block boundaries
-    block_starts: list[int] = []
-    for i, line in enumerate(lines):
-        if line.strip().startswith("Boundary Location="):
-            block_starts.append(i)
 
+def _parse_unsteady(
+    lines: list[str], flow: FlowFile, *, block_starts: list[int],
+) -> None:
+    """Parse unsteady blocks.
+
+    *block_starts* lists the ``Boundary Location=`` line indices, as
+    collected by :func:`parse_flow` while reading.
+    """
+    name_pool: dict[str, str] = {}  # one shared string per river / reach name
     for idx, start in enumerate(block_starts):
         end = block_starts[idx + 1] if idx + 1 < len(block_starts) else len(lines)
         block = lines[start:end]
 
-        header = block[0].strip().split("=", 1)[1]
+        header = block[0].partition("=")[2]
         parts = [p.strip() for p in header.split(",")]
-        river = parts[0] if parts else ""
+        river = name_pool.setdefault(parts[0], parts[0])
         reach = parts[1] if len(parts) > 1 else ""
+        reach = name_pool.setdefault(reach, reach)
         station = parts[2] if len(parts) > 2 else ""
 
         bc = UnsteadyBoundaryCondition(river=river, reach=reach, river_station=station)
 
         j = 1
-        while j < len(block):
-            s = block[j].strip()
+        n_block = len(block)
+        while j < n_block:
+            s = block[j]
+            if s[:1] in _INDENT:
+                s = s.lstrip()
 
             if s.startswith("Interval="):
-                bc.interval = s.split("=", 1)[1].strip()
+                bc.interval = s.partition("=")[2].strip()
                 j += 1
                 continue
 
             if s.startswith("Friction Slope="):
                 bc.bc_type = "Normal Depth"
-                bc.friction_slope = _float(s.split("=", 1)[1])
+                bc.friction_slope = _float(s.partition("=")[2])
                 j += 1
                 continue
 
             if s.startswith("Use DSS="):
-                raw = s.split("=", 1)[1].strip().lower()
+                raw = s.partition("=")[2].strip().lower()
                 bc.use_dss = raw in ("true", "-1", "1")
                 j += 1
                 continue
 
             if s.startswith("DSS File="):
-                bc.dss_file = s.split("=", 1)[1].strip()
+                bc.dss_file = s.partition("=")[2].strip()
                 j += 1
                 continue
 
             if s.startswith("DSS Path="):
-                bc.dss_path = s.split("=", 1)[1].strip()
+                bc.dss_path = s.partition("=")[2].strip()
                 j += 1
                 continue
 
-            # Check for hydrograph / data keywords
+            # Check for hydrograph / data keywords.  Most lines here are
+            # numeric data, which the first-character test rejects at once.
             matched = False
-            for keyword, bc_name in _HYDRO_KEYWORDS.items():
-                if s.startswith(keyword + "="):
-                    bc.bc_type = bc_name
-                    count = _int(s.split("=", 1)[1])
-                    if count > 0:
-                        bc.data, j = _read_fixed_values(block, j + 1, count)
-                    else:
-                        j += 1
-                    matched = True
-                    break
+            if s[:1] in _HYDRO_FIRST_CHARS:
+                for keyword in _HYDRO_KEYWORDS:
+                    if s.startswith(keyword + "="):
+                        bc.bc_type = keyword
+                        count = _int(s.partition("=")[2])
+                        if count > 0:
+                            bc.data, j = _read_fixed_values(block, j + 1, count)
+                        else:
+                            j += 1
+                        matched = True
+                        break
             if matched:
                 continue
 
@@ -328,23 +378,21 @@ def _parse_unsteady(lines: list[str], flow: FlowFile) -> None:
 
         flow.unsteady_boundaries.append(bc)
 
-    # Initial condition flows (River Rch & RM= outside Boundary Location blocks)
-    boundary_ranges = set()
-    for idx, start in enumerate(block_starts):
-        end = block_starts[idx + 1] if idx + 1 < len(block_starts) else len(lines)
-        for k in range(start, end):
-            boundary_ranges.add(k)
-
+    # Initial condition flows (River Rch & RM= outside Boundary Location
+    # blocks).  Each block runs to the next block start and the last one to
+    # end-of-file, so only the lines before the first block can hold them.
+    n = block_starts[0] if block_starts else len(lines)
     i = 0
-    while i < len(lines):
-        if i in boundary_ranges:
-            i += 1
-            continue
-        s = lines[i].strip()
+    while i < n:
+        s = lines[i]
+        if s[:1] in _INDENT:
+            s = s.lstrip()
         if s.startswith("River Rch & RM="):
-            parts = s.split("=", 1)[1].split(",")
+            parts = s.partition("=")[2].split(",")
             river = parts[0].strip()
             reach = parts[1].strip() if len(parts) > 1 else ""
+            river = name_pool.setdefault(river, river)
+            reach = name_pool.setdefault(reach, reach)
             try:
                 station = float(parts[2].strip()) if len(parts) > 2 else 0.0
             except ValueError:
@@ -361,7 +409,7 @@ def _parse_unsteady(lines: list[str], flow: FlowFile) -> None:
 # Public API
 # ---------------------------------------------------------------------------
 
-def parse_flow(filepath: str | Path) -> FlowFile:
+def parse_flow(filepath: str | Path, metadata_only: bool = False) -> FlowFile:
     """Parse a HEC-RAS steady (.f01) or unsteady (.u01) flow file.
 
     File type is detected from content: the presence of
@@ -371,34 +419,52 @@ def parse_flow(filepath: str | Path) -> FlowFile:
 
     Args:
         filepath: Path to the flow file.
+        metadata_only: Only read the header; the profile, flow and
+            boundary data are left empty.  Reading stops once the title,
+            program version and a ``Boundary Location=`` line have been
+            seen.  ``Number of Profiles=`` alone does not stop it, since a
+            later ``Boundary Location=`` still makes the file unsteady.
 
     Returns:
         A :class:`FlowFile` with profiles, flow-change locations, and
         boundary conditions populated for the detected type.
     """
     filepath = Path(filepath)
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-
     flow = FlowFile()
 
-    # --- metadata (shared between both formats) ---
-    for line in lines:
-        s = line.strip()
-        if s.startswith("Flow Title="):
-            flow.title = s.split("=", 1)[1].strip()
-        elif s.startswith("Program Version="):
-            flow.program_version = s.split("=", 1)[1].strip()
+    # Single pass: collect lines, shared metadata, the type markers, and the
+    # unsteady block boundaries.
+    lines: list[str] = []
+    block_starts: list[int] = []
+    has_profiles = False
+    with io.TextIOWrapper(
+        filepath.open("rb", buffering=_READ_BUFFER_SIZE),
+        encoding="utf-8", errors="replace",
+    ) as fh:
+        fh._CHUNK_SIZE = _READ_BUFFER_SIZE  # decode in large chunks too
+        for raw in fh:
+            line = raw.rstrip("\r\n")
+            lines.append(line)
+            s = line.lstrip() if line[:1] in _INDENT else line
+            if s.startswith("Flow Title="):
+                flow.title = s.partition("=")[2].strip()
+            elif s.startswith("Program Version="):
+                flow.program_version = s.partition("=")[2].strip()
+            elif s.startswith("Number of Profiles="):
+                has_profiles = True
+            elif s.startswith("Boundary Location="):
+                block_starts.append(len(lines) - 1)
+            # Only a block start settles the type; see "detect type".
+            if (
+                metadata_only
+                and block_starts
+                and flow.title
+                and flow.program_version
+            ):
+                break
 
     # --- detect type ---
-    has_profiles = any(
-        l.strip().startswith("Number of Profiles=") for l in lines
-    )
-    has_boundary_loc = any(
-        l.strip().startswith("Boundary Location=") for l in lines
-    )
-
-    if has_boundary_loc:
+    if block_starts:
         flow.is_steady = False
     elif has_profiles:
         flow.is_steady = True
@@ -407,12 +473,15 @@ def parse_flow(filepath: str | Path) -> FlowFile:
         ext = filepath.suffix.lower()
         flow.is_steady = not ext.startswith(".u")
 
+    if metadata_only:
+        return flow
+
     # --- delegate ---
     try:
         if flow.is_steady:
             _parse_steady(lines, flow)
         else:
-            _parse_unsteady(lines, flow)
+            _parse_unsteady(lines, flow, block_starts=block_starts)
     except Exception:
         logger.warning(
             "Error parsing flow file %s", filepath, exc_info=True
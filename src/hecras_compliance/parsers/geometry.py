@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +18,20 @@ logger = logging.getLogger(__name__)
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class StationElevation:
     station: float
     elevation: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ManningRegion:
     """Manning's n applied starting at a given station."""
     n_value: float
     start_station: float
 
 
-@dataclass
+@dataclass(slots=True)
 class IneffectiveFlowArea:
     """Region where water ponds but does not actively convey flow."""
     left_station: float
@@ -41,14 +42,14 @@ class IneffectiveFlowArea:
     right_permanent: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class LeveeStation:
     """Levee crest position — flow is blocked until water exceeds this elevation."""
     station: float
     elevation: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ReachLengths:
     """Downstream reach lengths to the next cross section."""
     left: float
@@ -56,13 +57,13 @@ class ReachLengths:
     right: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BankStations:
     left: float
     right: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DeckPoint:
     """One station along a bridge deck / roadway."""
     station: float
@@ -70,7 +71,7 @@ class DeckPoint:
     low_chord: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PierElevWidth:
     """Pier width at a given elevation."""
     elevation: float
@@ -244,16 +245,22 @@ def _read_fixed_values(
     values: list[float] = []
     idx = start
     while len(values) < count and idx < len(lines):
-        tokens = lines[idx].split()
-        parsed_any = False
-        for tok in tokens:
-            try:
-                values.append(float(tok))
+        # Split no further than needed; the unsplit tail is dropped.
+        remaining = count - len(values)
+        tokens = lines[idx].split(None, remaining)[:remaining]
+        try:
+            # Whole row converted in one C-level map; the common case.
+            values.extend(list(map(float, tokens)))
+            parsed_any = bool(tokens)
+        except ValueError:
+            # Keep the leading numeric tokens, as a keyword may follow.
+            parsed_any = False
+            for tok in tokens:
+                try:
+                    values.append(float(tok))
+                except ValueError:
+                    break
                 parsed_any = True
-            except ValueError:
-                break
-            if len(values) >= count:
-                break
         if not parsed_any:
             break
         idx += 1
@@ -262,14 +269,19 @@ def _read_fixed_values(
 
 def _parse_comma_floats(text: str) -> list[float]:
     """Parse ``'1.2 , 3.4 , 5'`` into ``[1.2, 3.4, 5.0]``."""
+    # float() ignores surrounding whitespace, so no per-part strip is needed.
+    parts = text.split(",")
+    try:
+        return list(map(float, parts))
+    except ValueError:
+        pass
+    # Blank or non-numeric parts are skipped.
     out: list[float] = []
-    for part in text.split(","):
-        part = part.strip()
-        if part:
-            try:
-                out.append(float(part))
-            except ValueError:
-                pass
+    for part in parts:
+        try:
+            out.append(float(part))
+        except ValueError:
+            pass
     return out
 
 
@@ -293,36 +305,63 @@ def _extract_description(lines: list[str], start: int) -> tuple[str, int]:
 # Block discovery
 # ---------------------------------------------------------------------------
 
-_TYPE_RE = "Type RM Length L Ch R"
-
+# Block keywords start in column one; only lines opening with one of these
+# are left-stripped, so unindented rows are never copied.
+_INDENT = (" ", "\t")
+
+_REACH_PREFIX = "River Reach="
+_TYPE_PREFIX = "Type RM Length L Ch R"
+_TITLE_PREFIX = "Geom Title="
+# Data rows are numeric, so a first-character test skips nearly every line.
+_DISCOVERY_FIRST_CHARS = frozenset(
+    p[0] for p in (_REACH_PREFIX, _TYPE_PREFIX, _TITLE_PREFIX)
+)
+# Tested on the raw line, before any strip: a keyword may also sit
+# behind indentation.
+_DISCOVERY_GATE = _DISCOVERY_FIRST_CHARS.union(_INDENT)
+
+
+def _read_geometry(
+    filepath: Path,
+) -> tuple[list[str], str, list[tuple[str, str, int, int]]]:
+    """Read *filepath* and locate its title and node blocks in one pass.
+
+    Returns ``(lines, title, boundaries)`` where *boundaries* holds
+    ``(river, reach, start_line, end_line)`` for every node block.
+    """
+    # A bulk decode and C-level split is faster than iterating the file.
+    lines = filepath.read_text(encoding="utf-8", errors="replace").splitlines()
 
-def _find_node_boundaries(
-    lines: list[str],
-) -> list[tuple[str, str, int, int]]:
-    """Return ``(river, reach, start_line, end_line)`` for every node block."""
+    title: str | None = None
     river, reach = "", ""
     starts: list[tuple[str, str, int]] = []
-
     for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("River Reach="):
-            parts = stripped.split("=", 1)[1].split(",", 1)
+        if line[:1] not in _DISCOVERY_GATE:
+            continue
+        s = line.lstrip() if line[:1] in _INDENT else line
+        if s[:1] not in _DISCOVERY_FIRST_CHARS:
+            continue
+        if s.startswith(_REACH_PREFIX):
+            parts = s.split("=", 1)[1].split(",", 1)
             river = parts[0].strip()
             reach = parts[1].strip() if len(parts) > 1 else ""
-        elif stripped.startswith(_TYPE_RE):
+        elif s.startswith(_TYPE_PREFIX):
             starts.append((river, reach, i))
+        elif title is None and s.startswith(_TITLE_PREFIX):
+            title = s.split("=", 1)[1].strip()
 
     boundaries: list[tuple[str, str, int, int]] = []
-    for j, (r, rch, s) in enumerate(starts):
+    for j, (r, rch, start) in enumerate(starts):
         end = starts[j + 1][2] if j + 1 < len(starts) else len(lines)
-        boundaries.append((r, rch, s, end))
-    return boundaries
+        boundaries.append((r, rch, start, end))
+    return lines, title or "", boundaries
 
 
 def _parse_type_line(line: str) -> tuple[int, float, ReachLengths]:
     """Parse ``Type RM Length L Ch R = <type> ,<sta> ,<L> ,<Ch> ,<R>``."""
-    rhs = line.split("=", 1)[1]
-    parts = [p.strip() for p in rhs.split(",")]
+    # int() / float() ignore surrounding whitespace, so parts are not
+    # stripped; anything past the fifth value stays unsplit in parts[5].
+    parts = line.split("=", 1)[1].split(",", 5)
     node_type = int(parts[0])
     station = float(parts[1])
     left = float(parts[2]) if len(parts) > 2 else 0.0
@@ -334,239 +373,292 @@ def _parse_type_line(line: str) -> tuple[int, float, ReachLengths]:
 # ---------------------------------------------------------------------------
 # Cross-section block parser
 # ---------------------------------------------------------------------------
+#
+# Each handler receives the node, the text after the first ``=``, the block
+# lines and the index of the keyword line; it returns the next line index.
+
+_XSHandler = Callable[[CrossSection, str, list[str], int], int]
+
+
+def _xs_sta_elev(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    count = int(value.strip())
+    vals, i = _read_fixed_values(lines, i + 1, count * 2)
+    xs.station_elevation = [
+        StationElevation(vals[j], vals[j + 1])
+        for j in range(0, len(vals) - 1, 2)
+    ]
+    return i
+
+
+def _xs_mann(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    n_regions = int(value.split(",")[0].strip())
+    vals, i = _read_fixed_values(lines, i + 1, n_regions * 3)
+    xs.manning_regions = [
+        ManningRegion(n_value=vals[j], start_station=vals[j + 1])
+        for j in range(0, len(vals) - 2, 3)
+    ]
+    return i
+
+
+def _xs_bank_sta(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    parts = _parse_comma_floats(value)
+    if len(parts) >= 2:
+        xs.bank_stations = BankStations(parts[0], parts[1])
+    return i + 1
+
+
+def _xs_exp_cntr(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    parts = _parse_comma_floats(value)
+    if len(parts) >= 2:
+        xs.expansion = parts[0]
+        xs.contraction = parts[1]
+    return i + 1
+
+
+def _xs_ineffective(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    n_areas = int(value.split(",")[0].strip())
+    vals, i = _read_fixed_values(lines, i + 1, n_areas * 6)
+    for j in range(0, len(vals) - 5, 6):
+        xs.ineffective_areas.append(
+            IneffectiveFlowArea(
+                left_station=vals[j],
+                left_elevation=vals[j + 1],
+                left_permanent=vals[j + 2] != 0,
+                right_station=vals[j + 3],
+                right_elevation=vals[j + 4],
+                right_permanent=vals[j + 5] != 0,
+            )
+        )
+    return i
+
+
+def _xs_levee_table(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    n_levees = int(value.split(",")[0].strip())
+    # Each levee entry: station, elevation, permanent flag (triplet)
+    vals, i = _read_fixed_values(lines, i + 1, n_levees * 3)
+    for j in range(0, len(vals) - 1, 3):
+        xs.levee_stations.append(
+            LeveeStation(station=vals[j], elevation=vals[j + 1])
+        )
+    return i
+
+
+def _xs_levee(xs: CrossSection, value: str, lines: list[str], i: int) -> int:
+    # Bare "Levee=" (comma-delimited, no count header); "Levee= " is ignored
+    if not value.startswith(" "):
+        parts = _parse_comma_floats(value)
+        for j in range(0, len(parts) - 1, 2):
+            xs.levee_stations.append(
+                LeveeStation(station=parts[j], elevation=parts[j + 1])
+            )
+    return i + 1
+
+
+_XS_HANDLERS: dict[str, _XSHandler] = {
+    "#Sta/Elev": _xs_sta_elev,
+    "#Mann": _xs_mann,
+    "Bank Sta": _xs_bank_sta,
+    "Exp/Cntr": _xs_exp_cntr,
+    "#IEffective": _xs_ineffective,
+    "#Levee": _xs_levee_table,
+    "Levee": _xs_levee,
+}
+
 
 def _parse_cross_section(lines: list[str], river: str, reach: str) -> CrossSection:
     node_type, station, rl = _parse_type_line(lines[0])
     xs = CrossSection(river_station=station, river=river, reach=reach, reach_lengths=rl)
 
+    handlers = _XS_HANDLERS
     i = 1
     while i < len(lines):
         s = lines[i].strip()
+        key, sep, value = s.partition("=")
+
+        handler = handlers.get(key) if sep else None
+        if handler is not None:
+            i = handler(xs, value, lines, i)
+            continue
 
         if s.startswith("BEGIN DESCRIPTION"):
             xs.description, i = _extract_description(lines, i)
             continue
 
-        if s.startswith("#Sta/Elev="):
-            count = int(s.split("=")[1].strip())
-            vals, i = _read_fixed_values(lines, i + 1, count * 2)
-            xs.station_elevation = [
-                StationElevation(vals[j], vals[j + 1])
-                for j in range(0, len(vals) - 1, 2)
-            ]
-            continue
+        i += 1
 
-        if s.startswith("#Mann="):
-            header = s.split("=")[1].split(",")
-            n_regions = int(header[0].strip())
-            vals, i = _read_fixed_values(lines, i + 1, n_regions * 3)
-            xs.manning_regions = [
-                ManningRegion(n_value=vals[j], start_station=vals[j + 1])
-                for j in range(0, len(vals) - 2, 3)
-            ]
-            continue
+    return xs
 
-        if s.startswith("Bank Sta="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            if len(parts) >= 2:
-                xs.bank_stations = BankStations(parts[0], parts[1])
-            i += 1
-            continue
 
-        if s.startswith("Exp/Cntr="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            if len(parts) >= 2:
-                xs.expansion = parts[0]
-                xs.contraction = parts[1]
-            i += 1
-            continue
+# ---------------------------------------------------------------------------
+# Bridge / culvert block parser
+# ---------------------------------------------------------------------------
+#
+# Handlers follow the cross-section convention.  The pier being described
+# is always the last one appended by a ``Pier Skew=`` line.
 
-        if s.startswith("#IEffective="):
-            header = s.split("=")[1].split(",")
-            n_areas = int(header[0].strip())
-            vals, i = _read_fixed_values(lines, i + 1, n_areas * 6)
-            for j in range(0, len(vals) - 5, 6):
-                xs.ineffective_areas.append(
-                    IneffectiveFlowArea(
-                        left_station=vals[j],
-                        left_elevation=vals[j + 1],
-                        left_permanent=vals[j + 2] != 0,
-                        right_station=vals[j + 3],
-                        right_elevation=vals[j + 4],
-                        right_permanent=vals[j + 5] != 0,
-                    )
-                )
-            continue
+_BridgeHandler = Callable[[Bridge, str, list[str], int], int]
 
-        if s.startswith("#Levee="):
-            header = s.split("=")[1].split(",")
-            n_levees = int(header[0].strip())
-            # Each levee entry: station, elevation, permanent flag (triplet)
-            vals, i = _read_fixed_values(lines, i + 1, n_levees * 3)
-            for j in range(0, len(vals) - 1, 3):
-                xs.levee_stations.append(
-                    LeveeStation(station=vals[j], elevation=vals[j + 1])
-                )
-            continue
 
-        # Bare "Levee=" (comma-delimited, no count header)
-        if s.startswith("Levee=") and not s.startswith("Levee= "):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            for j in range(0, len(parts) - 1, 2):
-                xs.levee_stations.append(
-                    LeveeStation(station=parts[j], elevation=parts[j + 1])
-                )
-            i += 1
-            continue
+def _br_node_name(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    br.node_name = value.strip()
+    return i + 1
 
-        i += 1
 
-    return xs
+# ---- deck / roadway ------------------------------------------------------
 
+def _br_deck(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    header = value.split(",")
+    n_pts = int(header[0].strip())
+    width = float(header[1].strip()) if len(header) > 1 else 0.0
+    vals, i = _read_fixed_values(lines, i + 1, n_pts * 3)
+    deck = BridgeDeck(width=width)
+    for j in range(0, len(vals) - 2, 3):
+        deck.points.append(
+            DeckPoint(vals[j], vals[j + 1], vals[j + 2])
+        )
+    br.deck = deck
+    return i
 
-# ---------------------------------------------------------------------------
-# Bridge / culvert block parser
-# ---------------------------------------------------------------------------
 
-def _parse_bridge(lines: list[str], river: str, reach: str) -> Bridge:
-    _, station, rl = _parse_type_line(lines[0])
-    br = Bridge(river_station=station, river=river, reach=reach, reach_lengths=rl)
+def _br_weir_coef(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    parts = _parse_comma_floats(value)
+    if br.deck and len(parts) >= 2:
+        br.deck.us_weir_coef = parts[0]
+        br.deck.ds_weir_coef = parts[1]
+    return i + 1
 
-    current_pier: Pier | None = None
-    i = 1
 
-    while i < len(lines):
-        s = lines[i].strip()
+def _br_deck_dist(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    parts = _parse_comma_floats(value)
+    if br.deck and len(parts) >= 2:
+        br.deck.us_dist = parts[0]
+        br.deck.ds_dist = parts[1]
+    return i + 1
 
-        if s.startswith("BEGIN DESCRIPTION"):
-            br.description, i = _extract_description(lines, i)
-            continue
 
-        if s.startswith("Node Name="):
-            br.node_name = s.split("=", 1)[1].strip()
-            i += 1
-            continue
+# ---- boundary stations ---------------------------------------------------
 
-        # ---- deck / roadway ------------------------------------------------
-        if s.startswith("#Deck/Roadway="):
-            header = s.split("=")[1].split(",")
-            n_pts = int(header[0].strip())
-            width = float(header[1].strip()) if len(header) > 1 else 0.0
-            vals, i = _read_fixed_values(lines, i + 1, n_pts * 3)
-            deck = BridgeDeck(width=width)
-            for j in range(0, len(vals) - 2, 3):
-                deck.points.append(
-                    DeckPoint(vals[j], vals[j + 1], vals[j + 2])
-                )
-            br.deck = deck
-            continue
+def _br_us_boundary(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    parts = _parse_comma_floats(value)
+    if len(parts) >= 2:
+        br.us_boundary_sta = (parts[0], parts[1])
+    return i + 1
 
-        if s.startswith("BC Design Weir Coef="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            if br.deck and len(parts) >= 2:
-                br.deck.us_weir_coef = parts[0]
-                br.deck.ds_weir_coef = parts[1]
-            i += 1
-            continue
 
-        if s.startswith("Deck Dist="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            if br.deck and len(parts) >= 2:
-                br.deck.us_dist = parts[0]
-                br.deck.ds_dist = parts[1]
-            i += 1
-            continue
+def _br_ds_boundary(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    parts = _parse_comma_floats(value)
+    if len(parts) >= 2:
+        br.ds_boundary_sta = (parts[0], parts[1])
+    return i + 1
 
-        # ---- boundary stations ---------------------------------------------
-        if s.startswith("US Boundary Condition Sta="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            if len(parts) >= 2:
-                br.us_boundary_sta = (parts[0], parts[1])
-            i += 1
-            continue
 
-        if s.startswith("DS Boundary Condition Sta="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            if len(parts) >= 2:
-                br.ds_boundary_sta = (parts[0], parts[1])
-            i += 1
-            continue
+# ---- bridge geometry -----------------------------------------------------
 
-        # ---- bridge geometry -----------------------------------------------
-        if s.startswith("Bridge Skew="):
-            try:
-                br.skew = float(s.split("=", 1)[1].strip())
-            except ValueError:
-                pass
-            i += 1
-            continue
+def _br_skew(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    try:
+        br.skew = float(value.strip())
+    except ValueError:
+        pass
+    return i + 1
 
-        # ---- piers ---------------------------------------------------------
-        if s.startswith("#Pier="):
-            # Just the count — actual pier objects created when Pier Skew= seen
-            i += 1
-            continue
 
-        if s.startswith("Pier Skew="):
-            current_pier = Pier(skew=float(s.split("=", 1)[1].strip()))
-            br.piers.append(current_pier)
-            i += 1
-            continue
+# ---- piers ---------------------------------------------------------------
+# "#Pier=" is just the count; pier objects are created when Pier Skew= seen.
 
-        if s.startswith("Center Sta Upstream="):
-            if current_pier:
-                current_pier.center_sta_upstream = float(
-                    s.split("=", 1)[1].strip()
-                )
-            i += 1
-            continue
+def _br_pier_skew(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    br.piers.append(Pier(skew=float(value.strip())))
+    return i + 1
 
-        if s.startswith("Center Sta Downstream="):
-            if current_pier:
-                current_pier.center_sta_downstream = float(
-                    s.split("=", 1)[1].strip()
-                )
-            i += 1
-            continue
 
-        if s.startswith("#Pier Elev="):
-            n_pairs = int(s.split("=")[1].strip())
-            vals, i = _read_fixed_values(lines, i + 1, n_pairs * 2)
-            if current_pier:
-                for j in range(0, len(vals) - 1, 2):
-                    current_pier.elevations.append(
-                        PierElevWidth(vals[j], vals[j + 1])
-                    )
-            continue
+def _br_center_us(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    if br.piers:
+        br.piers[-1].center_sta_upstream = float(value.strip())
+    return i + 1
 
-        # ---- modelling & coefficients --------------------------------------
-        if s.startswith("Bridge Modeling Approach="):
-            parts = _parse_comma_floats(s.split("=", 1)[1])
-            br.modeling_approach = [int(v) for v in parts]
-            i += 1
-            continue
 
-        if s.startswith("Bridge Coef Energy="):
-            br.energy_coefs = _parse_comma_floats(s.split("=", 1)[1])
-            i += 1
-            continue
+def _br_center_ds(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    if br.piers:
+        br.piers[-1].center_sta_downstream = float(value.strip())
+    return i + 1
 
-        if s.startswith("Bridge Coef PI Yarnell="):
-            br.yarnell_coefs = _parse_comma_floats(s.split("=", 1)[1])
-            i += 1
-            continue
 
-        if s.startswith("Bridge Coef Momentum="):
-            try:
-                br.momentum_coef = float(s.split("=", 1)[1].strip())
-            except ValueError:
-                pass
-            i += 1
+def _br_pier_elev(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    n_pairs = int(value.strip())
+    vals, i = _read_fixed_values(lines, i + 1, n_pairs * 2)
+    if br.piers:
+        elevations = br.piers[-1].elevations
+        for j in range(0, len(vals) - 1, 2):
+            elevations.append(PierElevWidth(vals[j], vals[j + 1]))
+    return i
+
+
+# ---- modelling & coefficients --------------------------------------------
+
+def _br_modeling(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    br.modeling_approach = [int(v) for v in _parse_comma_floats(value)]
+    return i + 1
+
+
+def _br_energy(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    br.energy_coefs = _parse_comma_floats(value)
+    return i + 1
+
+
+def _br_yarnell(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    br.yarnell_coefs = _parse_comma_floats(value)
+    return i + 1
+
+
+def _br_momentum(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    try:
+        br.momentum_coef = float(value.strip())
+    except ValueError:
+        pass
+    return i + 1
+
+
+def _br_wspro(br: Bridge, value: str, lines: list[str], i: int) -> int:
+    br.wspro_coefs = _parse_comma_floats(value)
+    return i + 1
+
+
+_BRIDGE_HANDLERS: dict[str, _BridgeHandler] = {
+    "Node Name": _br_node_name,
+    "#Deck/Roadway": _br_deck,
+    "BC Design Weir Coef": _br_weir_coef,
+    "Deck Dist": _br_deck_dist,
+    "US Boundary Condition Sta": _br_us_boundary,
+    "DS Boundary Condition Sta": _br_ds_boundary,
+    "Bridge Skew": _br_skew,
+    "Pier Skew": _br_pier_skew,
+    "Center Sta Upstream": _br_center_us,
+    "Center Sta Downstream": _br_center_ds,
+    "#Pier Elev": _br_pier_elev,
+    "Bridge Modeling Approach": _br_modeling,
+    "Bridge Coef Energy": _br_energy,
+    "Bridge Coef PI Yarnell": _br_yarnell,
+    "Bridge Coef Momentum": _br_momentum,
+    "Bridge WSPRO Data Coef": _br_wspro,
+}
+
+
+def _parse_bridge(lines: list[str], river: str, reach: str) -> Bridge:
+    _, station, rl = _parse_type_line(lines[0])
+    br = Bridge(river_station=station, river=river, reach=reach, reach_lengths=rl)
+
+    handlers = _BRIDGE_HANDLERS
+    i = 1
+    while i < len(lines):
+        s = lines[i].strip()
+        key, sep, value = s.partition("=")
+
+        handler = handlers.get(key) if sep else None
+        if handler is not None:
+            i = handler(br, value, lines, i)
             continue
 
-        if s.startswith("Bridge WSPRO Data Coef="):
-            br.wspro_coefs = _parse_comma_floats(s.split("=", 1)[1])
-            i += 1
+        if s.startswith("BEGIN DESCRIPTION"):
+            br.description, i = _extract_description(lines, i)
             continue
 
         i += 1
@@ -588,19 +680,10 @@ def parse_geometry(filepath: str | Path) -> GeometryFile:
         A :class:`GeometryFile` containing all cross sections and bridges.
         Sections that cannot be parsed are skipped with a log warning.
     """
-    filepath = Path(filepath)
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-
-    title = ""
-    for line in lines:
-        if line.strip().startswith("Geom Title="):
-            title = line.split("=", 1)[1].strip()
-            break
-
+    lines, title, boundaries = _read_geometry(Path(filepath))
     geom = GeometryFile(title=title)
 
-    for river, reach, start, end in _find_node_boundaries(lines):
+    for river, reach, start, end in boundaries:
         block = lines[start:end]
         try:
             node_type, _, _ = _parse_type_line(block[0])
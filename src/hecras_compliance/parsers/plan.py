@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -155,24 +156,29 @@ class PlanFile:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# The spellings HEC-RAS actually writes, resolved without calling int().
+_FLAG_VALUES: dict[str, bool] = {"": False, "0": False, "1": True, "-1": True}
+
+
 def _flag(value: str) -> bool:
     """Interpret a HEC-RAS boolean flag.
 
     HEC-RAS uses ``0`` for *off* and either ``1`` or ``-1`` for *on*.
     """
     value = value.strip()
-    if not value:
-        return False
+    flag = _FLAG_VALUES.get(value)
+    if flag is not None:
+        return flag
     try:
         return int(value) != 0
     except ValueError:
         return value.lower() in ("true", "yes")
 
 
+# The parser hands these already-stripped values; float() and int() reject
+# blank input themselves, so there is no separate strip or emptiness test.
+
 def _float(value: str, default: float = 0.0) -> float:
-    value = value.strip()
-    if not value:
-        return default
     try:
         return float(value)
     except ValueError:
@@ -180,25 +186,28 @@ def _float(value: str, default: float = 0.0) -> float:
 
 
 def _int(value: str, default: int = 0) -> int:
-    value = value.strip()
-    if not value:
-        return default
     try:
         return int(value)
     except ValueError:
         return default
 
 
-def _comma_floats(text: str) -> list[float]:
-    out: list[float] = []
-    for part in text.split(","):
+def _comma_floats(text: str) -> Iterator[float]:
+    """Yield the parseable comma-separated floats in *text*, lazily.
+
+    Empty or non-numeric fields are skipped; callers that only need the
+    first value stop partitioning there.
+    """
+    while True:
+        part, sep, text = text.partition(",")
         part = part.strip()
         if part:
             try:
-                out.append(float(part))
+                yield float(part)
             except ValueError:
                 pass
-    return out
+        if not sep:
+            return
 
 
 # ---------------------------------------------------------------------------
@@ -211,6 +220,119 @@ _FLOW_REGIMES = {
     "Mixed Flow": "Mixed",
     "Mixed Flow Regime": "Mixed",
 }
+_FLOW_REGIME_FIRST_CHARS = frozenset(k[0] for k in _FLOW_REGIMES)
+
+_PlanHandler = Callable[[PlanFile, str], None]
+
+
+def _setter(
+    section: str, attr: str, convert: Callable[[str], object]
+) -> _PlanHandler:
+    """Build a handler storing ``convert(value)`` on *attr* of *section*.
+
+    *section* names a :class:`PlanFile` sub-settings field, or is empty to
+    set the attribute on the plan itself.
+    """
+    if not section:
+        def handler(plan: PlanFile, value: str) -> None:
+            setattr(plan, attr, convert(value))
+    else:
+        def handler(plan: PlanFile, value: str) -> None:
+            setattr(getattr(plan, section), attr, convert(value))
+    return handler
+
+
+def _text(value: str) -> str:
+    return value
+
+
+def _profile_names(value: str) -> list[str]:
+    return [p.strip() for p in value.split(",") if p.strip()]
+
+
+def _encroach_param(plan: PlanFile, value: str) -> None:
+    # Only the first field (the encroachment on/off flag) matters here.
+    if next(_comma_floats(value), 0.0) != 0:
+        plan.encroachment.enabled = True
+
+
+def _enc_val_setter(index: int) -> _PlanHandler:
+    """Build a handler for one ``Encroach Val N`` slot.
+
+    :class:`EncroachmentSettings` always starts with all four slots, so
+    the value is stored in place.
+    """
+    def handler(plan: PlanFile, value: str) -> None:
+        plan.encroachment.values[index] = _float(value)
+    return handler
+
+
+# "Profiles" is only a count (names follow on "Profile Names"), so it is
+# not listed; unknown keys are ignored.
+_PLAN_HANDLERS: dict[str, _PlanHandler] = {
+    # ---- metadata ------------------------------------------------------
+    "Plan Title": _setter("", "title", _text),
+    "Program Version": _setter("", "program_version", _text),
+    "Short Identifier": _setter("", "short_identifier", _text),
+    "Simulation Date": _setter("", "simulation_date", _text),
+    "Geom File": _setter("", "geom_file", _text),
+    "Flow File": _setter("", "flow_file", _text),
+    "Plan Type": _setter("", "plan_type", _int),
+    "Profile Names": _setter("", "profiles", _profile_names),
+    "Paused": _setter("", "paused", _flag),
+    # ---- computational settings ----------------------------------------
+    "Flow Tolerance": _setter(
+        "computation", "flow_tolerance", lambda v: _float(v, 0.01)
+    ),
+    "Wl Tolerance": _setter(
+        "computation", "ws_tolerance", lambda v: _float(v, 0.01)
+    ),
+    "Critical Always Calculated": _setter(
+        "computation", "critical_always", _flag
+    ),
+    "Friction Slope Method": _setter(
+        "computation", "friction_slope_method", lambda v: _int(v, 1)
+    ),
+    "Flow Ratio": _setter(
+        "computation", "flow_ratio", lambda v: _float(v, 0.01)
+    ),
+    "Split Flow Opt": _setter("computation", "split_flow", _flag),
+    "Warm Up": _setter("computation", "warm_up", _flag),
+    "Computation Interval": _setter(
+        "computation", "computation_interval", _text
+    ),
+    "Flow Tolerance Method": _setter(
+        "computation", "flow_tolerance_method", _int
+    ),
+    "Check Data": _setter("computation", "check_data", _flag),
+    # ---- encroachment / floodway ---------------------------------------
+    "Encroach Param": _encroach_param,
+    "Encroach Method": _setter("encroachment", "method", _int),
+    **{f"Encroach Val {n}": _enc_val_setter(n - 1) for n in range(1, 5)},
+    # ---- output / run flags --------------------------------------------
+    "Run HTab": _setter("output", "run_htab", _flag),
+    "Run Post Process": _setter("output", "run_post_process", _flag),
+    "Run Sed": _setter("output", "run_sediment", _flag),
+    "Run UNET": _setter("output", "run_unet", _flag),
+    "Run RAS Mapper": _setter("output", "run_ras_mapper", _flag),
+    "Write IC File": _setter("output", "write_ic_file", _flag),
+    "Write Detailed": _setter("output", "write_detailed", _flag),
+    "Echo Input": _setter("output", "echo_input", _flag),
+    "Echo Parameters": _setter("output", "echo_parameters", _flag),
+    "Echo Output": _setter("output", "echo_output", _flag),
+    "Log Output Level": _setter("output", "log_output_level", _int),
+    "Output Interval": _setter("output", "output_interval", _text),
+    "Mapping Interval": _setter("output", "mapping_interval", _text),
+    "Hydrograph Output Interval": _setter(
+        "output", "hydrograph_output_interval", _text
+    ),
+    "Detailed Output Interval": _setter(
+        "output", "detailed_output_interval", _text
+    ),
+    "Instantaneous Interval": _setter(
+        "output", "instantaneous_interval", _text
+    ),
+}
 
 
 def parse_plan(filepath: str | Path) -> PlanFile:
@@ -224,130 +346,31 @@ def parse_plan(filepath: str | Path) -> PlanFile:
         encroachment/floodway parameters, and output intervals.
         Missing keywords are left at their dataclass defaults.
     """
-    filepath = Path(filepath)
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-
     plan = PlanFile()
-    comp = plan.computation
-    enc = plan.encroachment
-    out = plan.output
-
-    for raw_line in lines:
-        stripped = raw_line.strip()
-
-        # ---- bare keywords (no '=') ------------------------------------
-        if stripped in _FLOW_REGIMES:
-            plan.flow_regime = _FLOW_REGIMES[stripped]
-            continue
-
-        if "=" not in stripped:
-            continue
-
-        key, _, value = stripped.partition("=")
-        key = key.strip()
-        value = value.strip()
-
-        # ---- metadata --------------------------------------------------
-        if key == "Plan Title":
-            plan.title = value
-        elif key == "Program Version":
-            plan.program_version = value
-        elif key == "Short Identifier":
-            plan.short_identifier = value
-        elif key == "Simulation Date":
-            plan.simulation_date = value
-        elif key == "Geom File":
-            plan.geom_file = value
-        elif key == "Flow File":
-            plan.flow_file = value
-        elif key == "Plan Type":
-            plan.plan_type = _int(value)
-        elif key == "Profiles":
-            pass  # just a count; names are on the next keyword
-        elif key == "Profile Names":
-            plan.profiles = [p.strip() for p in value.split(",") if p.strip()]
-        elif key == "Paused":
-            plan.paused = _flag(value)
-
-        # ---- computational settings ------------------------------------
-        elif key == "Flow Tolerance":
-            comp.flow_tolerance = _float(value, 0.01)
-        elif key == "Wl Tolerance":
-            comp.ws_tolerance = _float(value, 0.01)
-        elif key == "Critical Always Calculated":
-            comp.critical_always = _flag(value)
-        elif key == "Friction Slope Method":
-            comp.friction_slope_method = _int(value, 1)
-        elif key == "Flow Ratio":
-            comp.flow_ratio = _float(value, 0.01)
-        elif key == "Split Flow Opt":
-            comp.split_flow = _flag(value)
-        elif key == "Warm Up":
-            comp.warm_up = _flag(value)
-        elif key == "Computation Interval":
-            comp.computation_interval = value
-        elif key == "Flow Tolerance Method":
-            comp.flow_tolerance_method = _int(value)
-        elif key == "Check Data":
-            comp.check_data = _flag(value)
-
-        # ---- encroachment / floodway -----------------------------------
-        elif key == "Encroach Param":
-            vals = _comma_floats(value)
-            if vals and vals[0] != 0:
-                enc.enabled = True
-        elif key == "Encroach Method":
-            enc.method = _int(value)
-        elif key == "Encroach Val 1":
-            _set_enc_val(enc, 0, value)
-        elif key == "Encroach Val 2":
-            _set_enc_val(enc, 1, value)
-        elif key == "Encroach Val 3":
-            _set_enc_val(enc, 2, value)
-        elif key == "Encroach Val 4":
-            _set_enc_val(enc, 3, value)
-
-        # ---- output / run flags ----------------------------------------
-        elif key == "Run HTab":
-            out.run_htab = _flag(value)
-        elif key == "Run Post Process":
-            out.run_post_process = _flag(value)
-        elif key == "Run Sed":
-            out.run_sediment = _flag(value)
-        elif key == "Run UNET":
-            out.run_unet = _flag(value)
-        elif key == "Run RAS Mapper":
-            out.run_ras_mapper = _flag(value)
-        elif key == "Write IC File":
-            out.write_ic_file = _flag(value)
-        elif key == "Write Detailed":
-            out.write_detailed = _flag(value)
-        elif key == "Echo Input":
-            out.echo_input = _flag(value)
-        elif key == "Echo Parameters":
-            out.echo_parameters = _flag(value)
-        elif key == "Echo Output":
-            out.echo_output = _flag(value)
-        elif key == "Log Output Level":
-            out.log_output_level = _int(value)
-        elif key == "Output Interval":
-            out.output_interval = value
-        elif key == "Mapping Interval":
-            out.mapping_interval = value
-        elif key == "Hydrograph Output Interval":
-            out.hydrograph_output_interval = value
-        elif key == "Detailed Output Interval":
-            out.detailed_output_interval = value
-        elif key == "Instantaneous Interval":
-            out.instantaneous_interval = value
+    handlers = _PLAN_HANDLERS
+
+    with open(filepath, encoding="utf-8", errors="replace") as fh:
+        for raw_line in fh:
+            stripped = raw_line.strip()
+
+            # ---- bare keywords (no '=') --------------------------------
+            if "=" not in stripped:
+                if (
+                    stripped[:1] in _FLOW_REGIME_FIRST_CHARS
+                    and stripped in _FLOW_REGIMES
+                ):
+                    plan.flow_regime = _FLOW_REGIMES[stripped]
+                continue
+
+            # *stripped* has no outer whitespace, so only the sides that
+            # meet the '=' need trimming.
+            key, _, value = stripped.partition("=")
+            key = key.rstrip()
+            value = value.lstrip()
+
+            handler = handlers.get(key)
+            if handler is not None:
+                handler(plan, value)
 
     return plan
 
-
-def _set_enc_val(enc: EncroachmentSettings, index: int, raw: str) -> None:
-    """Set one of the four encroachment value slots, growing the list if needed."""
-    v = _float(raw)
-    while len(enc.values) <= index:
-        enc.values.append(0.0)
-    enc.values[index] = v
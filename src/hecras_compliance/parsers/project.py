@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,44 @@ def _float(raw: str, default: float = 0.0) -> float:
 # Parser
 # ---------------------------------------------------------------------------
 
+_ProjectHandler = Callable[[ProjectFile, str], None]
+
+
+def _set_title(prj: ProjectFile, value: str) -> None:
+    prj.title = value
+
+
+def _set_current_plan(prj: ProjectFile, value: str) -> None:
+    prj.current_plan = value
+
+
+def _appender(attr: str) -> _ProjectHandler:
+    """Build a handler appending non-empty values to the *attr* list."""
+    def handler(prj: ProjectFile, value: str) -> None:
+        if value:
+            getattr(prj, attr).append(value)
+    return handler
+
+
+def _set_exp_contr(prj: ProjectFile, value: str) -> None:
+    expansion, sep, rest = value.partition(",")
+    if sep:
+        prj.default_expansion = _float(expansion, 0.3)
+        prj.default_contraction = _float(rest.partition(",")[0], 0.1)
+
+
+_PROJECT_HANDLERS: dict[str, _ProjectHandler] = {
+    "Proj Title": _set_title,
+    "Current Plan": _set_current_plan,
+    "Geom File": _appender("geom_files"),
+    "Steady File": _appender("steady_files"),
+    "Unsteady File": _appender("unsteady_files"),
+    "QuasiSteady File": _appender("quasi_files"),
+    "Plan File": _appender("plan_files"),
+    "Default Exp/Contr": _set_exp_contr,
+}
+
+
 def parse_project(filepath: str | Path) -> ProjectFile:
     """Parse a HEC-RAS project file.
 
@@ -81,71 +120,51 @@ def parse_project(filepath: str | Path) -> ProjectFile:
         A :class:`ProjectFile` with file references, units, description,
         and default coefficients populated.
     """
-    filepath = Path(filepath)
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    lines = text.splitlines()
-
     prj = ProjectFile()
-
-    i = 0
-    while i < len(lines):
-        stripped = lines[i].strip()
-
-        # ---- bare keywords (no '=') --------------------------------------
-        if stripped == "English Units":
-            prj.units = "English"
-            i += 1
-            continue
-        if stripped in ("SI Units", "SI Metric"):
-            prj.units = "SI Metric"
-            i += 1
-            continue
-
-        # ---- description block --------------------------------------------
-        if stripped == "BEGIN DESCRIPTION:":
-            desc_lines: list[str] = []
-            i += 1
-            while i < len(lines) and lines[i].strip() != "END DESCRIPTION:":
-                desc_lines.append(lines[i].rstrip())
-                i += 1
-            prj.description = "\n".join(desc_lines)
-            i += 1  # skip END DESCRIPTION:
-            continue
-
-        # ---- keyword=value lines ------------------------------------------
-        if "=" not in stripped:
-            i += 1
-            continue
-
-        key, _, value = stripped.partition("=")
-        key = key.strip()
-        value = value.strip()
-
-        if key == "Proj Title":
-            prj.title = value
-        elif key == "Current Plan":
-            prj.current_plan = value
-        elif key == "Geom File":
-            if value:
-                prj.geom_files.append(value)
-        elif key == "Steady File":
-            if value:
-                prj.steady_files.append(value)
-        elif key == "Unsteady File":
-            if value:
-                prj.unsteady_files.append(value)
-        elif key == "QuasiSteady File":
-            if value:
-                prj.quasi_files.append(value)
-        elif key == "Plan File":
-            if value:
-                prj.plan_files.append(value)
-        elif key == "Default Exp/Contr":
-            parts = value.split(",")
-            if len(parts) >= 2:
-                prj.default_expansion = _float(parts[0], 0.3)
-                prj.default_contraction = _float(parts[1], 0.1)
-
-        i += 1
+    handlers = _PROJECT_HANDLERS
+    in_description = False
+    desc_lines: list[str] = []
+
+    with open(filepath, encoding="utf-8", errors="replace") as fh:
+        for raw_line in fh:
+            stripped = raw_line.strip()
+
+            # ---- description block ----------------------------------------
+            if in_description:
+                if stripped == "END DESCRIPTION:":
+                    prj.description = "\n".join(desc_lines)
+                    in_description = False
+                else:
+                    desc_lines.append(raw_line.rstrip())
+                continue
+            if stripped == "BEGIN DESCRIPTION:":
+                in_description = True
+                desc_lines = []
+                continue
+
+            # ---- bare keywords (no '=') -----------------------------------
+            if stripped == "English Units":
+                prj.units = "English"
+                continue
+            if stripped in ("SI Units", "SI Metric"):
+                prj.units = "SI Metric"
+                continue
+
+            # ---- keyword=value lines --------------------------------------
+            if "=" not in stripped:
+                continue
+
+            # *stripped* has no outer whitespace, so only the sides that
+            # meet the '=' need trimming.
+            key, _, value = stripped.partition("=")
+            key = key.rstrip()
+            value = value.lstrip()
+
+            handler = handlers.get(key)
+            if handler is not None:
+                handler(prj, value)
+
+    if in_description:  # unterminated block runs to end of file
+        prj.description = "\n".join(desc_lines)
 
     return prj
@@ -1,4 +1,29 @@
-from .markdown_report import generate_markdown_report
-from .pdf_report import generate_pdf_report
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .markdown_report import generate_markdown_report
+    from .pdf_report import generate_pdf_report
 
 __all__ = ["generate_markdown_report", "generate_pdf_report"]
+
+# Imported on first access (PEP 562) so Markdown-only callers skip fpdf2.
+_LAZY_ATTRS: dict[str, str] = {
+    "generate_markdown_report": ".markdown_report",
+    "generate_pdf_report": ".pdf_report",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import functools
+import io
+from collections import defaultdict
 from datetime import date
 from pathlib import Path
 
@@ -12,7 +14,7 @@ from hecras_compliance.rules.engine import RuleResult
 # Category mapping — group rules by rule-ID prefix
 # ---------------------------------------------------------------------------
 
-_CATEGORY_ORDER = [
+_CATEGORY_ORDER = (
     "Manning's n",
     "Expansion / Contraction Coefficients",
     "Floodway / Surcharge",
@@ -21,7 +23,7 @@ _CATEGORY_ORDER = [
     "Boundary Conditions",
     "Freeboard",
     "Other",
-]
+)
 
 _PREFIX_TO_CATEGORY: dict[str, str] = {
     "MANN": "Manning's n",
@@ -34,12 +36,17 @@ _PREFIX_TO_CATEGORY: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def _categorize(rule_id: str) -> str:
-    """Map a rule ID like ``FEMA-MANN-001`` to a display category."""
-    parts = rule_id.split("-")
-    for part in parts:
-        if part in _PREFIX_TO_CATEGORY:
-            return _PREFIX_TO_CATEGORY[part]
+    """Map a rule ID like ``FEMA-MANN-001`` to a display category.
+
+    Cached because a report repeats the same few rule IDs across every
+    cross-section and bridge.
+    """
+    for part in rule_id.split("-"):
+        category = _PREFIX_TO_CATEGORY.get(part)
+        if category is not None:
+            return category
     return "Other"
 
 
@@ -50,6 +57,57 @@ _STATUS_ICON = {
     "SKIPPED": "SKIP",
 }
 
+_EMPTY_CELL = "—"
+_CITATION_WIDTH = 60  # longer citations are cut to fit the table
+
+
+# ---------------------------------------------------------------------------
+# Templates — fixed report text, filled once per section
+# ---------------------------------------------------------------------------
+
+_HEADER_TMPL = """\
+# HEC-RAS Compliance Report
+
+| Field | Value |
+|:------|:------|
+{model_row}| **Date** | {date} |
+| **Federal Rules** | FEMA Guidelines & Specifications |
+| **State Rules** | {state} |
+
+"""
+
+_SUMMARY_TMPL = """\
+## Executive Summary
+
+| Status | Count |
+|:-------|------:|
+| PASS | {n_pass} |
+| FAIL | {n_fail} |
+| WARNING | {n_warn} |
+| SKIPPED | {n_skip} |
+| **Total** | **{total}** |
+
+> {verdict}
+
+"""
+
+_CATEGORY_TMPL = """\
+### {category}
+
+| Status | Rule | Location | Model Value | Required | Citation |
+|:-------|:-----|:---------|:------------|:---------|:---------|
+"""
+
+_DISCLAIMER = (
+    "---\n"
+    "\n"
+    "*This report was generated by an automated compliance checking tool. "
+    "All results must be reviewed and verified by a licensed Professional "
+    "Engineer (PE). This tool does not replace engineering judgment and is "
+    "not a substitute for a thorough review of the hydraulic model by a "
+    "qualified professional.*\n"
+)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -73,150 +131,130 @@ def generate_markdown_report(
     Returns:
         The full Markdown string.
     """
-    lines: list[str] = []
+    # Bucket by status and by category in a single pass.  Recommendations
+    # keep FAIL and WARNING results interleaved in their original order.
+    by_status: dict[str, list[RuleResult]] = defaultdict(list)
+    actionable: list[RuleResult] = []
+    grouped: dict[str, list[RuleResult]] = defaultdict(list)
+    for r in results:
+        status = r.status
+        by_status[status].append(r)
+        if status == "FAIL" or status == "WARNING":
+            actionable.append(r)
+        grouped[_categorize(r.rule_id)].append(r)
+    failures = by_status["FAIL"]
+
+    buf = io.StringIO()
+    w = buf.write
 
     # ------------------------------------------------------------------
     # 1. Header
     # ------------------------------------------------------------------
-    lines.append("# HEC-RAS Compliance Report")
-    lines.append("")
-    lines.append(f"| Field | Value |")
-    lines.append(f"|:------|:------|")
-    if model_filename:
-        lines.append(f"| **Model** | `{model_filename}` |")
-    lines.append(f"| **Date** | {date.today().isoformat()} |")
-    lines.append(f"| **Federal Rules** | FEMA Guidelines & Specifications |")
-    if state:
-        lines.append(f"| **State Rules** | {state} |")
-    else:
-        lines.append(f"| **State Rules** | None |")
-    lines.append("")
+    w(_HEADER_TMPL.format(
+        model_row=f"| **Model** | `{model_filename}` |\n" if model_filename else "",
+        date=date.today().isoformat(),
+        state=state or "None",
+    ))
 
     # ------------------------------------------------------------------
     # 2. Executive summary
     # ------------------------------------------------------------------
-    counts = Counter(r.status for r in results)
     total = len(results)
-    n_pass = counts.get("PASS", 0)
-    n_fail = counts.get("FAIL", 0)
-    n_warn = counts.get("WARNING", 0)
-    n_skip = counts.get("SKIPPED", 0)
-
-    lines.append("## Executive Summary")
-    lines.append("")
-    lines.append(f"| Status | Count |")
-    lines.append(f"|:-------|------:|")
-    lines.append(f"| PASS | {n_pass} |")
-    lines.append(f"| FAIL | {n_fail} |")
-    lines.append(f"| WARNING | {n_warn} |")
-    lines.append(f"| SKIPPED | {n_skip} |")
-    lines.append(f"| **Total** | **{total}** |")
-    lines.append("")
+    n_pass = len(by_status["PASS"])
+    n_fail = len(failures)
+    n_warn = len(by_status["WARNING"])
+    n_skip = len(by_status["SKIPPED"])
 
     if n_fail == 0 and n_warn == 0:
-        lines.append("> All checks passed. No compliance issues detected.")
+        verdict = "All checks passed. No compliance issues detected."
     elif n_fail == 0:
-        lines.append(
-            f"> No critical failures. {n_warn} warning(s) require review."
-        )
+        verdict = f"No critical failures. {n_warn} warning(s) require review."
     else:
-        lines.append(
-            f"> **{n_fail} critical failure(s)** must be resolved before submission."
+        verdict = (
+            f"**{n_fail} critical failure(s)** must be resolved before submission."
         )
-    lines.append("")
+    w(_SUMMARY_TMPL.format(
+        n_pass=n_pass, n_fail=n_fail, n_warn=n_warn, n_skip=n_skip,
+        total=total, verdict=verdict,
+    ))
 
     # ------------------------------------------------------------------
     # 3. Critical failures
     # ------------------------------------------------------------------
-    failures = [r for r in results if r.status == "FAIL"]
     if failures:
-        lines.append("## Critical Failures")
-        lines.append("")
+        w("## Critical Failures\n\n")
         for r in failures:
             loc = f" at {r.location}" if r.location else ""
-            lines.append(f"- **{r.rule_id}** — {r.rule_name}{loc}")
-            lines.append(f"  - Model has: `{r.actual_value}`")
-            lines.append(f"  - Required: `{r.expected_value}`")
-            lines.append(f"  - {r.message}")
-        lines.append("")
+            w(
+                f"- **{r.rule_id}** — {r.rule_name}{loc}\n"
+                f"  - Model has: `{r.actual_value}`\n"
+                f"  - Required: `{r.expected_value}`\n"
+                f"  - {r.message}\n"
+            )
+        w("\n")
 
     # ------------------------------------------------------------------
     # 4. Detailed results grouped by category
     # ------------------------------------------------------------------
-    grouped: dict[str, list[RuleResult]] = defaultdict(list)
-    for r in results:
-        grouped[_categorize(r.rule_id)].append(r)
+    w("## Detailed Results\n\n")
 
-    lines.append("## Detailed Results")
-    lines.append("")
+    icon = _STATUS_ICON.get
 
     for category in _CATEGORY_ORDER:
         cat_results = grouped.get(category)
         if not cat_results:
             continue
 
-        lines.append(f"### {category}")
-        lines.append("")
-        lines.append("| Status | Rule | Location | Model Value | Required | Citation |")
-        lines.append("|:-------|:-----|:---------|:------------|:---------|:---------|")
-
+        w(_CATEGORY_TMPL.format(category=category))
         for r in cat_results:
-            status = _STATUS_ICON.get(r.status, r.status)
-            loc = r.location or "—"
-            actual = r.actual_value or "—"
-            expected = r.expected_value or "—"
-            citation = r.citation if len(r.citation) <= 60 else r.citation[:57] + "..."
-            lines.append(
-                f"| {status} | {r.rule_name} | {loc} | {actual} | {expected} | {citation} |"
+            citation = r.citation
+            if len(citation) > _CITATION_WIDTH:
+                citation = citation[:_CITATION_WIDTH - 3] + "..."
+            w(
+                f"| {icon(r.status, r.status)} | {r.rule_name} "
+                f"| {r.location or _EMPTY_CELL} "
+                f"| {r.actual_value or _EMPTY_CELL} "
+                f"| {r.expected_value or _EMPTY_CELL} | {citation} |\n"
             )
-
-        lines.append("")
+        w("\n")
 
     # ------------------------------------------------------------------
     # 5. Recommendations
     # ------------------------------------------------------------------
-    actionable = [r for r in results if r.status in ("FAIL", "WARNING")]
     if actionable:
-        lines.append("## Recommendations")
-        lines.append("")
+        w("## Recommendations\n\n")
         for r in actionable:
             tag = "FAIL" if r.status == "FAIL" else "WARN"
             loc = f" at {r.location}" if r.location else ""
-            lines.append(f"### [{tag}] {r.rule_id} — {r.rule_name}{loc}")
-            lines.append("")
-            lines.append(f"**Issue:** {r.message}")
-            lines.append("")
-            lines.append(f"**Citation:** {r.citation}")
-            lines.append("")
             if r.status == "FAIL":
-                lines.append(
-                    f"**Action:** Correct the value from `{r.actual_value}` "
+                action = (
+                    f"Correct the value from `{r.actual_value}` "
                     f"to within the required range of `{r.expected_value}`. "
                     f"Re-run the model after making corrections."
                 )
             else:
-                lines.append(
-                    f"**Action:** Review the value `{r.actual_value}` against "
+                action = (
+                    f"Review the value `{r.actual_value}` against "
                     f"the expected `{r.expected_value}`. Provide justification "
                     f"if the current value is intentional."
                 )
-            lines.append("")
+            w(
+                f"### [{tag}] {r.rule_id} — {r.rule_name}{loc}\n"
+                f"\n"
+                f"**Issue:** {r.message}\n"
+                f"\n"
+                f"**Citation:** {r.citation}\n"
+                f"\n"
+                f"**Action:** {action}\n"
+                f"\n"
+            )
 
     # ------------------------------------------------------------------
     # 6. Disclaimer
     # ------------------------------------------------------------------
-    lines.append("---")
-    lines.append("")
-    lines.append(
-        "*This report was generated by an automated compliance checking tool. "
-        "All results must be reviewed and verified by a licensed Professional "
-        "Engineer (PE). This tool does not replace engineering judgment and is "
-        "not a substitute for a thorough review of the hydraulic model by a "
-        "qualified professional.*"
-    )
-    lines.append("")
-
-    report = "\n".join(lines)
+    w(_DISCLAIMER)
+
+    report = buf.getvalue()
 
     if output_path:
         Path(output_path).write_text(report, encoding="utf-8")
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import functools
+from collections import defaultdict
 from datetime import date
 from pathlib import Path
 
@@ -14,23 +15,33 @@ from hecras_compliance.rules.engine import RuleResult
 # Color palette
 # ---------------------------------------------------------------------------
 
+_PASS_COLOR = (34, 139, 34)      # forest green
+_FAIL_COLOR = (200, 30, 30)      # red
+_WARN_COLOR = (200, 150, 0)      # dark yellow / amber
+_SKIP_COLOR = (130, 130, 130)    # gray
+
 _COLORS = {
-    "PASS": (34, 139, 34),      # forest green
-    "FAIL": (200, 30, 30),      # red
-    "WARNING": (200, 150, 0),   # dark yellow / amber
-    "SKIPPED": (130, 130, 130), # gray
+    "PASS": _PASS_COLOR,
+    "FAIL": _FAIL_COLOR,
+    "WARNING": _WARN_COLOR,
+    "SKIPPED": _SKIP_COLOR,
 }
 
 _HEADER_BG = (41, 65, 106)     # dark navy
 _HEADER_FG = (255, 255, 255)   # white
 _ROW_ALT = (240, 244, 248)     # light blue-gray for alternating rows
 _WHITE = (255, 255, 255)
+_DEFAULT_TEXT = (60, 60, 60)   # status colour for unknown statuses
+
+# Detailed-results table: status, rule, location, actual, expected, citation
+_COL_WIDTHS = (14, 38, 18, 28, 28, 64)
+_TABLE_HEADERS = ("Status", "Rule", "Location", "Model Value", "Required", "Citation")
 
 # ---------------------------------------------------------------------------
 # Category mapping (shared with markdown_report)
 # ---------------------------------------------------------------------------
 
-_CATEGORY_ORDER = [
+_CATEGORY_ORDER = (
     "Manning's n",
     "Expansion / Contraction Coefficients",
     "Floodway / Surcharge",
@@ -39,7 +50,7 @@ _CATEGORY_ORDER = [
     "Boundary Conditions",
     "Freeboard",
     "Other",
-]
+)
 
 _PREFIX_TO_CATEGORY: dict[str, str] = {
     "MANN": "Manning's n",
@@ -52,11 +63,12 @@ _PREFIX_TO_CATEGORY: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=1024)
 def _categorize(rule_id: str) -> str:
-    parts = rule_id.split("-")
-    for part in parts:
-        if part in _PREFIX_TO_CATEGORY:
-            return _PREFIX_TO_CATEGORY[part]
+    for part in rule_id.split("-"):
+        category = _PREFIX_TO_CATEGORY.get(part)
+        if category is not None:
+            return category
     return "Other"
 
 
@@ -91,14 +103,17 @@ def _set_color(pdf: FPDF, rgb: tuple[int, int, int]) -> None:
     pdf.set_text_color(*rgb)
 
 
+_STATUS_LABELS = {"PASS": "PASS", "FAIL": "FAIL", "WARNING": "WARN", "SKIPPED": "SKIP"}
+
+
 def _status_label(status: str) -> str:
-    return {"PASS": "PASS", "FAIL": "FAIL", "WARNING": "WARN", "SKIPPED": "SKIP"}.get(
-        status, status
-    )
+    return _STATUS_LABELS.get(status, status)
 
 
 def _safe(text: str) -> str:
     """Replace characters that Helvetica (latin-1) cannot encode."""
+    if text.isascii():  # the usual case; a flag check, no scan
+        return text
     return (
         text
         .replace("\u2014", "--")   # em-dash
@@ -134,6 +149,20 @@ def generate_pdf_report(
         The :class:`Path` to the written PDF.
     """
     output_path = Path(output_path)
+
+    # Bucket by status and by category in a single pass.  Recommendations
+    # keep FAIL and WARNING results interleaved in their original order.
+    by_status: dict[str, list[RuleResult]] = defaultdict(list)
+    actionable: list[RuleResult] = []
+    grouped: dict[str, list[RuleResult]] = defaultdict(list)
+    for r in results:
+        status = r.status
+        by_status[status].append(r)
+        if status == "FAIL" or status == "WARNING":
+            actionable.append(r)
+        grouped[_categorize(r.rule_id)].append(r)
+    failures = by_status["FAIL"]
+
     pdf = _CompliancePDF(model_filename, state)
     pdf.alias_nb_pages()
     pdf.add_page()
@@ -165,12 +194,10 @@ def generate_pdf_report(
     # ------------------------------------------------------------------
     # 2. Executive summary
     # ------------------------------------------------------------------
-    counts = Counter(r.status for r in results)
-    total = len(results)
-    n_pass = counts.get("PASS", 0)
-    n_fail = counts.get("FAIL", 0)
-    n_warn = counts.get("WARNING", 0)
-    n_skip = counts.get("SKIPPED", 0)
+    n_pass = len(by_status["PASS"])
+    n_fail = len(failures)
+    n_warn = len(by_status["WARNING"])
+    n_skip = len(by_status["SKIPPED"])
 
     pdf.set_font("Helvetica", "B", 14)
     pdf.set_text_color(30, 30, 30)
@@ -184,10 +211,10 @@ def generate_pdf_report(
     y = pdf.get_y()
 
     for label, count, color in [
-        ("PASS", n_pass, _COLORS["PASS"]),
-        ("FAIL", n_fail, _COLORS["FAIL"]),
-        ("WARNING", n_warn, _COLORS["WARNING"]),
-        ("SKIPPED", n_skip, _COLORS["SKIPPED"]),
+        ("PASS", n_pass, _PASS_COLOR),
+        ("FAIL", n_fail, _FAIL_COLOR),
+        ("WARNING", n_warn, _WARN_COLOR),
+        ("SKIPPED", n_skip, _SKIP_COLOR),
     ]:
         pdf.set_fill_color(*color)
         pdf.set_text_color(255, 255, 255)
@@ -211,7 +238,7 @@ def generate_pdf_report(
     elif n_fail == 0:
         pdf.multi_cell(0, 5, f"No critical failures. {n_warn} warning(s) require review.")
     else:
-        pdf.set_text_color(*_COLORS["FAIL"])
+        pdf.set_text_color(*_FAIL_COLOR)
         pdf.set_font("Helvetica", "B", 10)
         pdf.multi_cell(
             0, 5,
@@ -222,7 +249,6 @@ def generate_pdf_report(
     # ------------------------------------------------------------------
     # 3. Critical failures
     # ------------------------------------------------------------------
-    failures = [r for r in results if r.status == "FAIL"]
     if failures:
         pdf.set_font("Helvetica", "B", 14)
         pdf.set_text_color(200, 30, 30)
@@ -233,7 +259,7 @@ def generate_pdf_report(
             loc = f" at {r.location}" if r.location else ""
             pdf.set_x(10)
             pdf.set_font("Helvetica", "B", 10)
-            pdf.set_text_color(*_COLORS["FAIL"])
+            pdf.set_text_color(*_FAIL_COLOR)
             pdf.multi_cell(0, 5, _safe(f"{r.rule_id} - {r.rule_name}{loc}"))
             pdf.set_font("Helvetica", "", 9)
             pdf.set_text_color(60, 60, 60)
@@ -250,16 +276,14 @@ def generate_pdf_report(
     # ------------------------------------------------------------------
     # 4. Detailed results by category
     # ------------------------------------------------------------------
-    grouped: dict[str, list[RuleResult]] = defaultdict(list)
-    for r in results:
-        grouped[_categorize(r.rule_id)].append(r)
-
     pdf.set_font("Helvetica", "B", 14)
     pdf.set_text_color(30, 30, 30)
     pdf.cell(0, 10, "Detailed Results", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(1)
 
-    col_widths = [14, 38, 18, 28, 28, 64]  # status, rule, loc, actual, expected, citation
+    col_widths = _COL_WIDTHS
+    cell = pdf.cell
+    status_color = _COLORS.get
 
     for category in _CATEGORY_ORDER:
         cat_results = grouped.get(category)
@@ -278,9 +302,8 @@ def generate_pdf_report(
         pdf.set_font("Helvetica", "B", 7)
         pdf.set_fill_color(*_HEADER_BG)
         pdf.set_text_color(*_HEADER_FG)
-        headers = ["Status", "Rule", "Location", "Model Value", "Required", "Citation"]
-        for i, h in enumerate(headers):
-            pdf.cell(col_widths[i], 6, h, border=0, fill=True, align="C")
+        for width, h in zip(col_widths, _TABLE_HEADERS):
+            cell(width, 6, h, border=0, fill=True, align="C")
         pdf.ln()
 
         # Rows
@@ -291,10 +314,9 @@ def generate_pdf_report(
 
             pdf.set_x(10)
             # Status cell — colored
-            color = _COLORS.get(r.status, (60, 60, 60))
-            pdf.set_text_color(*color)
+            pdf.set_text_color(*status_color(r.status, _DEFAULT_TEXT))
             pdf.set_font("Helvetica", "B", 7)
-            pdf.cell(col_widths[0], 5, _status_label(r.status), border=0, fill=True, align="C")
+            cell(col_widths[0], 5, _status_label(r.status), border=0, fill=True, align="C")
 
             # Remaining cells — dark text
             pdf.set_text_color(40, 40, 40)
@@ -306,11 +328,11 @@ def generate_pdf_report(
             expected = _safe((r.expected_value[:14] + "..") if len(r.expected_value) > 16 else r.expected_value) or "-"
             citation = _safe((r.citation[:38] + "..") if len(r.citation) > 40 else r.citation) or "-"
 
-            pdf.cell(col_widths[1], 5, rule_name, border=0, fill=True)
-            pdf.cell(col_widths[2], 5, loc, border=0, fill=True, align="C")
-            pdf.cell(col_widths[3], 5, actual, border=0, fill=True, align="C")
-            pdf.cell(col_widths[4], 5, expected, border=0, fill=True, align="C")
-            pdf.cell(col_widths[5], 5, citation, border=0, fill=True)
+            cell(col_widths[1], 5, rule_name, border=0, fill=True)
+            cell(col_widths[2], 5, loc, border=0, fill=True, align="C")
+            cell(col_widths[3], 5, actual, border=0, fill=True, align="C")
+            cell(col_widths[4], 5, expected, border=0, fill=True, align="C")
+            cell(col_widths[5], 5, citation, border=0, fill=True)
             pdf.ln()
 
         pdf.ln(4)
@@ -318,7 +340,6 @@ def generate_pdf_report(
     # ------------------------------------------------------------------
     # 5. Recommendations
     # ------------------------------------------------------------------
-    actionable = [r for r in results if r.status in ("FAIL", "WARNING")]
     if actionable:
         pdf.add_page()
         pdf.set_font("Helvetica", "B", 14)
@@ -327,7 +348,7 @@ def generate_pdf_report(
         pdf.ln(2)
 
         for r in actionable:
-            color = _COLORS.get(r.status, (60, 60, 60))
+            color = _COLORS.get(r.status, _DEFAULT_TEXT)
             tag = "FAIL" if r.status == "FAIL" else "WARN"
             loc = f" at {r.location}" if r.location else ""
 
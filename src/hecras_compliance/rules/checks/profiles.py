@@ -29,6 +29,18 @@ def _make_result(
     }
 
 
+def _accepted_lower(rule: dict) -> frozenset[str]:
+    """Return the rule's accepted names, normalised once and kept on the rule."""
+    accepted = rule.get("_accepted_lower")
+    if accepted is None:
+        accepted = frozenset(
+            n.strip().lower()
+            for n in rule["parameters"].get("accepted_names", [])
+        )
+        rule["_accepted_lower"] = accepted
+    return accepted
+
+
 def check_profile_exists(rule: dict, model_data: ModelData) -> list[dict]:
     """Check that at least one flow profile matches the accepted names."""
     if model_data.flow is None:
@@ -40,7 +52,6 @@ def check_profile_exists(rule: dict, model_data: ModelData) -> list[dict]:
             message="No flow file loaded; cannot check profile names.",
         )]
 
-    accepted = [n.lower() for n in rule["parameters"].get("accepted_names", [])]
     profile_names = model_data.flow.profile_names
 
     if not profile_names:
@@ -52,6 +63,7 @@ def check_profile_exists(rule: dict, model_data: ModelData) -> list[dict]:
             message="Flow file contains no profiles.",
         )]
 
+    accepted = _accepted_lower(rule)
     matched = any(
         pn.strip().lower() in accepted for pn in profile_names
     )
@@ -30,6 +30,17 @@ class TestVersion:
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
+    def test_import_does_not_load_pdf_backend(self):
+        """The PDF renderer is only imported when ``run --pdf`` needs it."""
+        import subprocess
+        import sys
+
+        code = "import sys, hecras_compliance.cli; print('fpdf' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "False"
+
 
 # ===================================================================
 # hecras-check run
@@ -205,6 +216,37 @@ class TestSummary:
         assert result.exit_code == 0
         assert "Encroachment" in result.output or "encroachment" in result.output
 
+    def test_summary_with_missing_referenced_files(self, runner, tmp_path):
+        """Only files actually present next to the .prj are parsed."""
+        import shutil
+
+        shutil.copy(FIXTURES / "sample.prj", tmp_path / "sample.prj")
+        shutil.copy(FIXTURES / "sample.g01", tmp_path / "sample.g01")
+        result = runner.invoke(cli, ["summary", str(tmp_path / "sample.prj")])
+        assert result.exit_code == 0
+        assert "Cross sections:" in result.output
+        assert "Flow regime:" not in result.output
+        assert "Boundary conditions:" not in result.output
+
+    def test_summary_matches_referenced_files_ignoring_case(self, runner, tmp_path):
+        """A file whose case differs from the .prj reference is still found."""
+        import shutil
+
+        shutil.copy(FIXTURES / "sample.prj", tmp_path / "sample.prj")
+        shutil.copy(FIXTURES / "sample.g01", tmp_path / "SAMPLE.G01")
+        shutil.copy(FIXTURES / "sample.f01", tmp_path / "Sample.f01")
+        result = runner.invoke(cli, ["summary", str(tmp_path / "sample.prj")])
+        assert result.exit_code == 0
+        assert "Cross sections:" in result.output
+        assert "Profiles:" in result.output
+
+    def test_summary_quick_shows_project_only(self, runner):
+        result = runner.invoke(cli, ["summary", SAMPLE_PRJ, "--quick"])
+        assert result.exit_code == 0
+        assert "Referenced Files" in result.output
+        assert "Cross sections:" not in result.output
+        assert "Profiles:" not in result.output
+
     def test_summary_nonexistent_file(self, runner):
         result = runner.invoke(cli, ["summary", "/nonexistent/file.prj"])
         assert result.exit_code != 0
@@ -282,3 +324,52 @@ class TestAddState:
         result = runner.invoke(cli, ["add-state"], input="Hawaii\nHI\nn\n")
         assert result.exit_code == 0
         assert "Aborted" in result.output
+
+
+# ===================================================================
+# State YAML metadata
+# ===================================================================
+
+
+class TestStateYamlCache:
+    @pytest.fixture(autouse=True)
+    def _isolate_states_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("hecras_compliance.cli._STATES_DIR", tmp_path)
+
+    def test_display_name_from_yaml(self, tmp_path):
+        from hecras_compliance.cli import _state_display_name
+
+        (tmp_path / "oregon.yaml").write_text("state: Oregon\n")
+        assert _state_display_name("oregon") == "Oregon"
+
+    def test_missing_file_falls_back_to_title(self):
+        from hecras_compliance.cli import _state_display_name
+
+        assert _state_display_name("new_mexico") == "New_Mexico"
+
+    def test_resolve_state_and_label(self, tmp_path):
+        from hecras_compliance.cli import _resolve_state_and_label
+
+        (tmp_path / "texas.yaml").write_text("state: Texas\n")
+        assert _resolve_state_and_label("TX") == ("texas", "Texas")
+        assert _resolve_state_and_label(None) == (None, None)
+
+    def test_repeated_lookup_is_cached(self, tmp_path):
+        from hecras_compliance.cli import _load_state_yaml
+
+        (tmp_path / "utah.yaml").write_text("state: Utah\n")
+        assert _load_state_yaml("utah") is _load_state_yaml("utah")
+
+    def test_modified_file_is_reread(self, tmp_path):
+        import os
+
+        from hecras_compliance.cli import _state_display_name
+
+        path = tmp_path / "idaho.yaml"
+        path.write_text("state: Idaho\n")
+        assert _state_display_name("idaho") == "Idaho"
+
+        path.write_text("state: Idaho (revised)\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert _state_display_name("idaho") == "Idaho (revised)"
@@ -497,6 +497,17 @@ class TestProfileChecks:
         ]
         assert tx_500[0].status == "FAIL"
 
+    def test_engine_reuse_rechecks_profiles(self):
+        engine = ComplianceEngine()
+        statuses = [
+            next(
+                r.status for r in engine.evaluate(_full_model(flow=_good_flow(names)))
+                if r.rule_id == "FEMA-EVENT-001"
+            )
+            for names in (["100yr"], ["10yr"], [" 100YR "])
+        ]
+        assert statuses == ["PASS", "FAIL", "PASS"]
+
 
 # ===================================================================
 # Boundary condition checks
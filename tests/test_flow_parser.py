@@ -189,6 +189,17 @@ class TestUnsteadyBoundaryConditionDataclass:
         assert bc.dss_path == ""
 
 
+class TestFlowChangeLocationDataclass:
+    def test_no_instance_dict(self):
+        loc = FlowChangeLocation("River", "Reach", 5000.0, [100.0])
+        assert not hasattr(loc, "__dict__")
+
+    def test_rejects_unknown_attribute(self):
+        loc = FlowChangeLocation("River", "Reach", 5000.0)
+        with pytest.raises(AttributeError):
+            loc.extra = 1
+
+
 # ===================================================================
 # Steady flow parsing (sample.f01)
 # ===================================================================
@@ -403,6 +414,50 @@ class TestTypeDetection:
         assert flow.is_steady is False
 
 
+class TestMetadataOnly:
+    @pytest.mark.parametrize("path", [STEADY_FILE, UNSTEADY_FILE])
+    def test_header_matches_full_parse(self, path: Path):
+        full = parse_flow(path)
+        meta = parse_flow(path, metadata_only=True)
+        assert meta.title == full.title
+        assert meta.program_version == full.program_version
+        assert meta.is_steady is full.is_steady
+
+    @pytest.mark.parametrize("path", [STEADY_FILE, UNSTEADY_FILE])
+    def test_body_not_parsed(self, path: Path):
+        meta = parse_flow(path, metadata_only=True)
+        assert meta.profiles == []
+        assert meta.flow_change_locations == []
+        assert meta.steady_boundaries == []
+        assert meta.unsteady_boundaries == []
+
+    def test_version_after_marker(self, tmp_path: Path):
+        content = textwrap.dedent("""\
+            Flow Title=Late Version
+            Boundary Location=R,Reach,100
+            Friction Slope=0.001
+            Program Version=6.30
+        """)
+        f = tmp_path / "late.u01"
+        f.write_text(content)
+        meta = parse_flow(f, metadata_only=True)
+        assert meta.title == "Late Version"
+        assert meta.program_version == "6.30"
+        assert meta.is_steady is False
+
+    def test_boundary_after_profile_count(self, tmp_path: Path):
+        content = textwrap.dedent("""\
+            Flow Title=Mixed Markers
+            Program Version=6.30
+            Number of Profiles= 1
+            Boundary Location=R,Reach,100
+        """)
+        f = tmp_path / "mixed.f01"
+        f.write_text(content)
+        meta = parse_flow(f, metadata_only=True)
+        assert meta.is_steady is parse_flow(f).is_steady is False
+
+
 # ===================================================================
 # Synthetic / edge-case tests
 # ===================================================================
@@ -451,6 +506,26 @@ class TestSyntheticSteady:
         assert bc.upstream_known_ws == pytest.approx(450.5)
         assert bc.downstream_known_ws == pytest.approx(440.2)
 
+    def test_boundary_keys_padded_and_unknown(self, tmp_path: Path):
+        content = textwrap.dedent("""\
+            Number of Profiles= 1
+            Profile Names=Base
+
+            Boundary for River Rch & Prof#=Test River,Test Reach, 1
+            Up Type = 3
+            Up Slope  = 0.002
+            Up Type Override= 1
+            Dn Type= 3
+            Dn Slope=bad
+        """)
+        f = tmp_path / "padded.f01"
+        f.write_text(content)
+        bc = parse_flow(f).steady_boundaries[0]
+        assert bc.upstream_type == 3
+        assert bc.upstream_slope == pytest.approx(0.002)
+        assert bc.downstream_type == 3
+        assert bc.downstream_slope == 0.0
+
     def test_empty_flow_file(self, tmp_path: Path):
         f = tmp_path / "empty.f01"
         f.write_text("")
@@ -567,6 +642,20 @@ class TestSyntheticUnsteady:
         assert flow.unsteady_boundaries[1].bc_type == "Normal Depth"
         assert flow.unsteady_boundaries[1].friction_slope == pytest.approx(0.003)
 
+    def test_repeated_river_names_share_one_string(self, tmp_path: Path):
+        content = textwrap.dedent("""\
+            Boundary Location=Big River,Upper,9000
+            Friction Slope=0.001
+            Boundary Location=Big River,Upper,1000
+            Friction Slope=0.002
+        """)
+        f = tmp_path / "shared.u01"
+        f.write_text(content)
+        first, second = parse_flow(f).unsteady_boundaries
+        assert first.river == second.river == "Big River"
+        assert first.river is second.river
+        assert first.reach is second.reach
+
 
 # ===================================================================
 # Import / public API
@@ -5,7 +5,14 @@ from pathlib import Path
 import pytest
 
 from hecras_compliance.parsers.geometry import (
+    BridgeDeck,
+    CrossSection,
+    DeckPoint,
     GeometryFile,
+    Pier,
+    PierElevWidth,
+    StationElevation,
+    _interpolate_pier_width,
     parse_geometry,
 )
 
@@ -203,6 +210,21 @@ class TestBridge:
     def test_min_low_chord(self):
         assert self.br.min_low_chord == pytest.approx(522)
 
+    def test_min_low_chord_follows_new_deck(self):
+        assert self.br.min_low_chord == pytest.approx(522)
+        self.br.deck = BridgeDeck(points=[DeckPoint(0, 530, 519.5)])
+        assert self.br.min_low_chord == pytest.approx(519.5)
+        self.br.deck.points.append(DeckPoint(10, 530, 518))
+        assert self.br.min_low_chord == pytest.approx(518)
+
+    def test_min_low_chord_follows_point_edits(self):
+        points = self.br.deck.points
+        assert self.br.min_low_chord == pytest.approx(522)
+        points[0] = DeckPoint(points[0].station, 530, 515)
+        assert self.br.min_low_chord == pytest.approx(515)
+        points[0].low_chord = 512
+        assert self.br.min_low_chord == pytest.approx(512)
+
     def test_weir_coefficients(self):
         assert self.br.deck.us_weir_coef == pytest.approx(2.6)
         assert self.br.deck.ds_weir_coef == pytest.approx(2.6)
@@ -253,6 +275,54 @@ class TestBridge:
         assert "Main Street Bridge" in self.br.description
 
 
+# ---- record dataclasses --------------------------------------------------
+
+def test_point_records_have_no_instance_dict(geom: GeometryFile):
+    point = geom.get_cross_section(5000).station_elevation[0]
+    assert isinstance(point, StationElevation)
+    assert not hasattr(point, "__dict__")
+
+
+# ---- pier width interpolation --------------------------------------------
+
+def _pier(*pairs: tuple[float, float]) -> Pier:
+    return Pier(elevations=[PierElevWidth(e, w) for e, w in pairs])
+
+
+def test_pier_width_interpolates_between_rows():
+    pier = _pier((10, 2), (15, 3), (20, 5))
+    assert _interpolate_pier_width(pier, 12.5) == pytest.approx(2.5)
+    assert _interpolate_pier_width(pier, 15) == pytest.approx(3)
+    assert _interpolate_pier_width(pier, 17.5) == pytest.approx(4)
+
+
+def test_pier_width_clamps_to_table_ends():
+    pier = _pier((10, 2), (20, 5))
+    assert _interpolate_pier_width(pier, 5) == 2
+    assert _interpolate_pier_width(pier, 25) == 5
+
+
+def test_pier_width_unsorted_table_uses_first_bracketing_row():
+    pier = _pier((10, 2), (30, 6), (20, 4))
+    assert _interpolate_pier_width(pier, 15) == pytest.approx(3)
+
+
+def test_pier_width_follows_table_edits():
+    pier = _pier((10, 2), (20, 4))
+    assert _interpolate_pier_width(pier, 15) == pytest.approx(3)
+    pier.elevations.append(PierElevWidth(30, 10))
+    assert _interpolate_pier_width(pier, 25) == pytest.approx(7)
+
+
+def test_pier_width_follows_in_place_row_edits():
+    pier = _pier((10, 2), (20, 4), (30, 10))
+    assert _interpolate_pier_width(pier, 15) == pytest.approx(3)
+    pier.elevations[1] = PierElevWidth(12, 4)
+    assert _interpolate_pier_width(pier, 15) == pytest.approx(5)
+    pier.elevations[1].elevation = 25
+    assert _interpolate_pier_width(pier, 15) == pytest.approx(8 / 3)
+
+
 # ---- convenience lookups -------------------------------------------------
 
 def test_lookup_missing_station(geom: GeometryFile):
@@ -260,6 +330,52 @@ def test_lookup_missing_station(geom: GeometryFile):
     assert geom.get_bridge(9999) is None
 
 
+def test_lookup_tolerance(geom: GeometryFile):
+    assert geom.get_cross_section(5000.009).river_station == 5000
+    assert geom.get_cross_section(4999.991).river_station == 5000
+    assert geom.get_cross_section(5000.011) is None
+
+
+def test_lookup_duplicate_station_returns_first():
+    first = CrossSection(river_station=100.0, river="A", reach="Upper")
+    second = CrossSection(river_station=100.0, river="B", reach="Lower")
+    geom = GeometryFile(cross_sections=[
+        CrossSection(river_station=300.0, river="A", reach="Upper"),
+        first,
+        second,
+    ])
+    assert geom.get_cross_section(100.0) is first
+
+
+def test_lookup_sees_appended_sections():
+    geom = GeometryFile()
+    assert geom.get_cross_section(100.0) is None
+    xs = CrossSection(river_station=100.0, river="A", reach="Upper")
+    geom.cross_sections.append(xs)
+    assert geom.get_cross_section(100.0) is xs
+
+
+def test_lookup_sees_replaced_sections():
+    geom = GeometryFile()
+    geom.cross_sections.append(
+        CrossSection(river_station=100.0, river="A", reach="Upper")
+    )
+    assert geom.get_cross_section(100.0) is not None
+    xs = CrossSection(river_station=200.0, river="A", reach="Upper")
+    geom.cross_sections[0] = xs
+    assert geom.get_cross_section(200.0) is xs
+    assert geom.get_cross_section(100.0) is None
+
+
+def test_lookup_sees_edited_stations():
+    xs = CrossSection(river_station=100.0, river="A", reach="Upper")
+    geom = GeometryFile(cross_sections=[xs])
+    assert geom.get_cross_section(100.0) is xs
+    xs.river_station = 250.0
+    assert geom.get_cross_section(250.0) is xs
+    assert geom.get_cross_section(100.0) is None
+
+
 # ---- robustness: empty / garbage file ------------------------------------
 
 def test_empty_file(tmp_path: Path):
@@ -173,6 +173,12 @@ class TestFloodwayDerived:
         assert plan.encroachment.is_floodway is False
         assert plan.encroachment.target_surcharge is None
 
+    def test_blank_leading_param_field_is_skipped(self, tmp_path: Path):
+        plan = _write_and_parse(tmp_path, """\
+            Encroach Param= , -1 ,0
+        """)
+        assert plan.encroachment.enabled is True
+
     def test_no_encroachment_section(self, tmp_path: Path):
         plan = _write_and_parse(tmp_path, """\
             Plan Title=No encroachment
@@ -302,6 +308,18 @@ class TestFlagParsing:
         plan = _write_and_parse(tmp_path, "Run HTab=\n")
         assert plan.output.run_htab is False
 
+    def test_other_spellings_fall_back_to_parsing(self, tmp_path: Path):
+        plan = _write_and_parse(tmp_path, """\
+            Run HTab= 2
+            Run Sed= 00
+            Run UNET= True
+            Run RAS Mapper= off
+        """)
+        assert plan.output.run_htab is True
+        assert plan.output.run_sediment is False
+        assert plan.output.run_unet is True
+        assert plan.output.run_ras_mapper is False
+
 
 # ===================================================================
 # 7.  Robustness — missing / malformed input
@@ -328,6 +346,17 @@ class TestRobustness:
         """)
         assert plan.title == "OK"
 
+    def test_similar_keys_set_their_own_fields(self, tmp_path: Path):
+        plan = _write_and_parse(tmp_path, """\
+            Flow Tolerance Method = 2
+            Flow Tolerance = 0.02
+            Encroach Val 3= 5
+        """)
+        assert plan.computation.flow_tolerance_method == 2
+        assert plan.computation.flow_tolerance == pytest.approx(0.02)
+        assert plan.encroachment.values == [0.0, 0.0, 5.0, 0.0]
+        assert parse_plan(FIXTURE).encroachment.values[2] == 0.0
+
     def test_windows_line_endings(self, tmp_path: Path):
         content = (
             "Plan Title=CRLF\r\n"
@@ -256,6 +256,23 @@ class TestDescription:
         prj = parse_project(f)
         assert prj.description == ""
 
+    def test_keywords_inside_description_are_text(self, tmp_path: Path):
+        f = tmp_path / "kw.prj"
+        f.write_bytes(
+            b"BEGIN DESCRIPTION:\r\nGeom File=g09\r\nSI Units\r\n"
+            b"END DESCRIPTION:\r\nGeom File=g01\r\n"
+        )
+        prj = parse_project(f)
+        assert prj.description == "Geom File=g09\nSI Units"
+        assert prj.geom_files == ["g01"]
+        assert prj.units == ""
+
+    def test_unterminated_description_runs_to_end(self, tmp_path: Path):
+        f = tmp_path / "open.prj"
+        f.write_text("BEGIN DESCRIPTION:\nFirst\nSecond  \n")
+        prj = parse_project(f)
+        assert prj.description == "First\nSecond"
+
 
 class TestDefaultCoefficients:
     def test_custom_coefficients(self, tmp_path: Path):
@@ -272,6 +289,20 @@ class TestDefaultCoefficients:
         assert prj.default_expansion == pytest.approx(0.3)
         assert prj.default_contraction == pytest.approx(0.1)
 
+    def test_single_coefficient_keeps_defaults(self, tmp_path: Path):
+        f = tmp_path / "one.prj"
+        f.write_text("Default Exp/Contr=0.5\n")
+        prj = parse_project(f)
+        assert prj.default_expansion == pytest.approx(0.3)
+        assert prj.default_contraction == pytest.approx(0.1)
+
+    def test_extra_coefficients_ignored(self, tmp_path: Path):
+        f = tmp_path / "three.prj"
+        f.write_text("Default Exp/Contr=0.5,0.3,0.9\n")
+        prj = parse_project(f)
+        assert prj.default_expansion == pytest.approx(0.5)
+        assert prj.default_contraction == pytest.approx(0.3)
+
 
 class TestEdgeCases:
     def test_empty_file(self, tmp_path: Path):
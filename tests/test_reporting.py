@@ -208,6 +208,43 @@ class TestMarkdownReport:
         assert "# HEC-RAS Compliance Report" in md
         assert "| **Total** | **0** |" in md
 
+    def test_recommendations_keep_result_order(self):
+        def result(rule_id: str, status: str) -> RuleResult:
+            return RuleResult(
+                rule_id=rule_id, rule_name=rule_id, status=status,
+                severity="error", actual_value="1", expected_value="2",
+                citation="", citation_url="", message="",
+            )
+
+        results = [
+            result("FEMA-MANN-001", "WARNING"),
+            result("FEMA-COEF-001", "FAIL"),
+            result("FEMA-MANN-002", "PASS"),
+            result("FEMA-FW-001", "WARNING"),
+        ]
+        md = generate_markdown_report(results)
+        recs = md.split("## Recommendations", 1)[1]
+        assert (
+            recs.index("[WARN] FEMA-MANN-001")
+            < recs.index("[FAIL] FEMA-COEF-001")
+            < recs.index("[WARN] FEMA-FW-001")
+        )
+        assert "| PASS | 1 |" in md
+        assert "| FAIL | 1 |" in md
+        assert "| WARNING | 2 |" in md
+
+    def test_braces_in_values_are_literal(self):
+        md = generate_markdown_report(
+            [], model_filename="{model}.prj", state="{state}"
+        )
+        assert "| **Model** | `{model}.prj` |" in md
+        assert "| **State Rules** | {state} |" in md
+
+    def test_ends_with_single_newline(self):
+        md = generate_markdown_report(ComplianceEngine().evaluate(_failing_model()))
+        assert md.endswith("qualified professional.*\n")
+        assert "\n\n\n" not in md
+
 
 # ===================================================================
 # PDF report tests